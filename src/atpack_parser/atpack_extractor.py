@@ -1,11 +1,37 @@
 """AtPackExtractor class for extracting files from AtPack archives."""
 
 from pathlib import Path
+import fnmatch
+import re
 import zipfile
 import os
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from lxml import etree
+
 from .exceptions import ParseError
 
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+# Number of parsed XML trees kept per extractor
+_XML_CACHE_SIZE = 32
+
+
+def _path_matcher(pattern: Optional[str]) -> Callable[[str], bool]:
+    """Build a file path filter, glob patterns are compiled once, others match substrings."""
+    if not pattern:
+        return lambda path: True
+
+    glob_start = _GLOB_CHARS.search(pattern)
+    if glob_start is None:
+        return lambda path: pattern in path
+
+    # Cheap literal prefix check before running the compiled glob
+    prefix = pattern[: glob_start.start()]
+    match = re.compile(fnmatch.translate(pattern)).match
+    return lambda path: path.startswith(prefix) and match(path) is not None
+
 
 class AtPackExtractor:
     """Extract files from AtPack archives."""
@@ -13,35 +39,84 @@ class AtPackExtractor:
     def __init__(self, atpack_path: Path):
         """Initialize with AtPack file path."""
         self.atpack_path = Path(atpack_path)
+        self._zip_file: Optional[zipfile.ZipFile] = None
+        self._xml_cache: "OrderedDict[str, etree._Element]" = OrderedDict()
         if not self.atpack_path.exists():
             raise FileNotFoundError(f"AtPack file not found: {atpack_path}")
 
+    def __enter__(self) -> "AtPackExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the ZIP archive if it has been opened."""
+        zip_file = getattr(self, "_zip_file", None)
+        if zip_file is not None:
+            zip_file.close()
+            self._zip_file = None
+
+    def _open_zip(self) -> zipfile.ZipFile:
+        """Get the ZIP archive, reading its central directory only once."""
+        if self._zip_file is None:
+            self._zip_file = zipfile.ZipFile(self.atpack_path, "r")
+        return self._zip_file
+
     def is_directory(self) -> bool:
         """Check if the path is a directory (extracted AtPack)."""
         return self.atpack_path.is_dir()
 
     def is_zip_file(self) -> bool:
         """Check if the path is a ZIP file."""
+        if self._zip_file is not None:
+            return True
         return self.atpack_path.is_file() and zipfile.is_zipfile(self.atpack_path)
 
     def list_files(self, pattern: Optional[str] = None) -> List[str]:
         """List files in AtPack."""
+        matches = _path_matcher(pattern)
         if self.is_directory():
             files = []
             for root, _, filenames in os.walk(self.atpack_path):
                 for filename in filenames:
                     rel_path = os.path.relpath(
                         os.path.join(root, filename), self.atpack_path
-                    )
-                    if pattern is None or pattern in rel_path:
-                        files.append(rel_path.replace("\\", "/"))
+                    ).replace("\\", "/")
+                    if matches(rel_path):
+                        files.append(rel_path)
             return files
         elif self.is_zip_file():
-            with zipfile.ZipFile(self.atpack_path, "r") as zf:
-                files = zf.namelist()
-                if pattern:
-                    files = [f for f in files if pattern in f]
-                return files
+            files = self._open_zip().namelist()
+            if pattern:
+                files = [f for f in files if matches(f)]
+            return files
+        else:
+            raise ParseError(f"Unsupported AtPack format: {self.atpack_path}")
+
+    def file_sizes(self, pattern: Optional[str] = None) -> Dict[str, int]:
+        """Get uncompressed file sizes in AtPack without reading file contents."""
+        matches = _path_matcher(pattern)
+        if self.is_directory():
+            sizes = {}
+            for root, _, filenames in os.walk(self.atpack_path):
+                for filename in filenames:
+                    full_path = os.path.join(root, filename)
+                    rel_path = os.path.relpath(full_path, self.atpack_path).replace(
+                        "\\", "/"
+                    )
+                    if matches(rel_path):
+                        sizes[rel_path] = os.path.getsize(full_path)
+            return sizes
+        elif self.is_zip_file():
+            return {
+                info.filename: info.file_size
+                for info in self._open_zip().infolist()
+                if matches(info.filename)
+            }
         else:
             raise ParseError(f"Unsupported AtPack format: {self.atpack_path}")
 
@@ -53,14 +128,51 @@ class AtPackExtractor:
                 raise FileNotFoundError(f"File not found in AtPack: {file_path}")
             return full_path.read_text(encoding="utf-8", errors="ignore")
         elif self.is_zip_file():
-            with zipfile.ZipFile(self.atpack_path, "r") as zf:
-                try:
-                    return zf.read(file_path).decode("utf-8", errors="ignore")
-                except KeyError:
-                    raise FileNotFoundError(f"File not found in AtPack: {file_path}")
+            try:
+                return self._open_zip().read(file_path).decode("utf-8", errors="ignore")
+            except KeyError:
+                raise FileNotFoundError(f"File not found in AtPack: {file_path}")
+        else:
+            raise ParseError(f"Unsupported AtPack format: {self.atpack_path}")
+
+    def read_bytes(self, file_path: str) -> bytes:
+        """Read raw file content from AtPack."""
+        if self.is_directory():
+            full_path = self.atpack_path / file_path
+            if not full_path.exists():
+                raise FileNotFoundError(f"File not found in AtPack: {file_path}")
+            return full_path.read_bytes()
+        elif self.is_zip_file():
+            try:
+                return self._open_zip().read(file_path)
+            except KeyError:
+                raise FileNotFoundError(f"File not found in AtPack: {file_path}")
         else:
             raise ParseError(f"Unsupported AtPack format: {self.atpack_path}")
 
+    def read_xml(self, file_path: str) -> etree._Element:
+        """Read and parse an XML file from AtPack, reusing recently parsed trees."""
+        root = self._xml_cache.get(file_path)
+        if root is not None:
+            self._xml_cache.move_to_end(file_path)
+            return root
+
+        xml_data = self.read_bytes(file_path)
+        try:
+            root = etree.fromstring(xml_data)
+        except etree.XMLSyntaxError:
+            # Retry with undecodable bytes dropped, as read_file() does
+            xml_content = xml_data.decode("utf-8", errors="ignore")
+            try:
+                root = etree.fromstring(xml_content.encode("utf-8"))
+            except etree.XMLSyntaxError as e:
+                raise ParseError(f"Invalid XML content: {e}")
+
+        self._xml_cache[file_path] = root
+        if len(self._xml_cache) > _XML_CACHE_SIZE:
+            self._xml_cache.popitem(last=False)
+        return root
+
     def find_files(self, extensions: List[str]) -> Dict[str, List[str]]:
         """Find files with specific extensions."""
         result = {ext: [] for ext in extensions}
@@ -3,8 +3,8 @@
 from typing import Annotated
 
 import typer
-from rich.console import Console
 
+from .common import console
 from .config import config_app
 from .devices import devices_app
 from .files import files_app
@@ -14,9 +14,6 @@ from .memory import memory_app
 from .registers import registers_app
 from .tui_command import launch_tui
 
-# Create console for rich output
-console = Console()
-
 # Create Typer app with hierarchical commands
 app = typer.Typer(
     name="atpack",
@@ -1,16 +1,41 @@
 """Common types and utilities for CLI commands."""
 
+import json
+import re
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated, List
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import typer
+from pydantic import BaseModel
 from rapidfuzz import fuzz
 from rich.console import Console
 
+from .. import AtPackParser
+from ..display import get_console
 from ..exceptions import AtPackError, DeviceNotFoundError
+from ..models import AtPackMetadata, DeviceFamily
+from ..utils import cache
 
-# Create console for rich output
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional accelerator, see the "fast" extra
+    orjson = None
+
+# Shared console for rich output
+console = get_console()
 
 # Common types
 AtPackPath = Annotated[Path, typer.Argument(help="Path to AtPack file or directory")]
@@ -18,6 +43,195 @@ DeviceName = Annotated[
     str, typer.Argument(help="Device name (e.g., ATmega16, PIC16F876A)")
 ]
 OutputFormat = Annotated[str, typer.Option("--format", "-f", help="Output format")]
+OutputFile = Annotated[
+    Optional[Path], typer.Option("--output", "-o", help="Export to file")
+]
+NoColor = Annotated[bool, typer.Option("--no-color", help="Disable colored output")]
+
+
+def get_output_console(no_color: bool = False, record: bool = False) -> Console:
+    """Create the console for command output, without Rich's automatic highlighting."""
+    return Console(
+        force_terminal=not no_color, no_color=no_color, highlight=False, record=record
+    )
+
+
+@contextmanager
+def export_console(
+    output: Path, no_color: bool = False, width: Optional[int] = None
+) -> Iterator[Console]:
+    """Open a console that renders straight into an export file."""
+    with output.open("w", encoding="utf-8") as export_file:
+        yield Console(file=export_file, force_terminal=not no_color, width=width)
+
+
+# Non-ASCII characters, which only appear inside JSON strings
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(encoded: bytes) -> bytes:
+    """Escape non-ASCII characters like the standard JSON encoder does by default."""
+    if encoded.isascii():
+        return encoded
+    return _NON_ASCII.sub(
+        lambda match: json.dumps(match.group())[1:-1], encoded.decode()
+    ).encode("ascii")
+
+
+def _dumps_bytes(data: Any, pretty: bool = True) -> bytes:
+    """Encode data like json.dumps(data, indent=2), with orjson when installed.
+
+    Without pretty, the output is compact with no whitespace at all. orjson
+    spells some floats differently (1e-5 for 1e-05) and writes NaN and
+    infinity as null.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits, left to the standard encoder
+            pass
+        else:
+            return _escape_non_ascii(encoded)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _stdout_writer() -> Callable[[bytes], Any]:
+    """Get a function writing bytes to stdout, bypassing the text layer if possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        return lambda chunk: sys.stdout.write(chunk.decode())
+    # Keep anything already written as text ahead of the bytes
+    sys.stdout.flush()
+    return buffer.write
+
+
+def write_json(data: Any, output: Optional[Path] = None, pretty: bool = True) -> None:
+    """Write data as JSON to a file, or to stdout when output is None."""
+    if output:
+        output.write_bytes(_dumps_bytes(data, pretty))
+    else:
+        _stdout_writer()(_dumps_bytes(data, pretty) + b"\n")
+        sys.stdout.flush()
+
+
+def _write_json_array(
+    documents: Iterable[bytes], write: Callable[[bytes], Any], pretty: bool = True
+) -> None:
+    """Write JSON documents one at a time as the items of a JSON array.
+
+    Pretty documents are expected indented, the layout is then the one of
+    json.dump(items, indent=2). Otherwise documents are joined compactly.
+    """
+    first, separator = (b"[\n  ", b",\n  ") if pretty else (b"[", b",")
+    prefix = first
+    for document in documents:
+        if pretty:
+            document = document.replace(b"\n", b"\n  ")
+        write(prefix + document)
+        prefix = separator
+    if prefix == first:
+        write(b"[]")
+    else:
+        write(b"\n]" if pretty else b"]")
+
+
+def stream_models_json(
+    models: Iterable[BaseModel], output: Optional[Path] = None, pretty: bool = True
+) -> None:
+    """Write pydantic models as a JSON array without building the whole list.
+
+    Each model is serialized by pydantic-core directly, without an intermediate
+    model_dump() dict, into the same output as write_json would give.
+    """
+    indent = 2 if pretty else None
+    documents = (
+        _escape_non_ascii(model.model_dump_json(indent=indent).encode())
+        for model in models
+    )
+    if output:
+        with output.open("wb") as f:
+            _write_json_array(documents, f.write, pretty)
+    else:
+        write = _stdout_writer()
+        _write_json_array(documents, write, pretty)
+        write(b"\n")
+        sys.stdout.flush()
+
+
+def stream_json(items: Iterable[Any], pretty: bool = True) -> None:
+    """Write items to stdout as a JSON array, flushing each one once encoded."""
+    write = _stdout_writer()
+
+    def write_flushed(chunk: bytes) -> None:
+        write(chunk)
+        sys.stdout.flush()
+
+    documents = (_dumps_bytes(item, pretty) for item in items)
+    _write_json_array(documents, write_flushed, pretty)
+    write_flushed(b"\n")
+
+
+class AtPackSummary(NamedTuple):
+    """Metadata, device family and device names of an AtPack."""
+
+    metadata: AtPackMetadata
+    device_family: DeviceFamily
+    devices: List[str]
+
+
+def load_atpack_summary(atpack_path: Path) -> AtPackSummary:
+    """Load an AtPack summary, memoized on disk for AtPack zip files."""
+    cache_file = cache.cache_file(atpack_path, "summary")
+    if cache_file is not None:
+        summary = cache.load(cache_file)
+        if isinstance(summary, AtPackSummary):
+            return summary
+
+    parser = AtPackParser(atpack_path)
+    summary = AtPackSummary(parser.metadata, parser.device_family, parser.get_devices())
+
+    if cache_file is not None:
+        cache.store(cache_file, summary)
+    return summary
+
+
+# Number of AtPack zip parsers kept open in-process
+_PARSER_CACHE_SIZE = 8
+
+# Resolved path -> (modification time, parser), least recently used first
+_parser_cache: "OrderedDict[str, Tuple[int, AtPackParser]]" = OrderedDict()
+
+
+def get_parser(atpack_path: Path) -> AtPackParser:
+    """Get a parser for an AtPack, reused in-process while the file is unchanged."""
+    if not atpack_path.is_file():
+        # Extracted directories have no reliable mtime, always parse them
+        return AtPackParser(atpack_path)
+
+    resolved = atpack_path.resolve()
+    key = str(resolved)
+    mtime_ns = resolved.stat().st_mtime_ns
+
+    cached = _parser_cache.pop(key, None)
+    if cached is not None:
+        if cached[0] == mtime_ns:
+            _parser_cache[key] = cached
+            return cached[1]
+        # The file changed, release the handle on the old archive
+        cached[1].close()
+
+    parser = AtPackParser(resolved)
+    _parser_cache[key] = (mtime_ns, parser)
+    if len(_parser_cache) > _PARSER_CACHE_SIZE:
+        _, (_, evicted) = _parser_cache.popitem(last=False)
+        evicted.close()
+    return parser
 
 
 def _get_device_suggestions(
@@ -1,6 +1,5 @@
 """Config command group for AtPack CLI."""
 
-import json
 from typing import Annotated
 
 import typer
@@ -11,9 +10,11 @@ from ..exceptions import AtPackError, DeviceNotFoundError
 from .common import (
     AtPackPath,
     DeviceName,
+    OutputFormat,
     console,
     handle_atpack_error,
     handle_device_not_found_error,
+    write_json,
 )
 
 # Create config sub-command app
@@ -30,9 +31,7 @@ def show_config(
             "--type", "-t", help="Config type (fuses, config, interrupts, signatures)"
         ),
     ] = "all",
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
 ):
     """⚙️ Show configuration information for a device."""
     try:
@@ -53,7 +52,7 @@ def show_config(
                         data[key] = value.model_dump()
                     else:
                         data[key] = value
-                print(json.dumps(data, indent=2))
+                write_json(data)
             else:
                 items = config.get(config_type, [])
                 if (
@@ -66,7 +65,7 @@ def show_config(
                     data = items.model_dump()
                 else:
                     data = items
-                print(json.dumps(data, indent=2))
+                write_json(data)
         else:
             if config_type in ["all", "fuses"] and config["fuses"]:
                 table = Table(title="🔒 Fuse Configuration")
@@ -1,16 +1,30 @@
 """Devices command group for AtPack CLI."""
 
+import csv
 import fnmatch
-import json
+import re
+import sys
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import (
+    Annotated,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from .. import AtPackParser
+from ..display.styles import get_styles
 from ..exceptions import AtPackError, DeviceNotFoundError
 from ..models import DeviceFamily
 from ..utils.device_specs import (
@@ -28,15 +42,46 @@ from ..utils.units import (
 from .common import (
     AtPackPath,
     DeviceName,
+    NoColor,
+    OutputFile,
+    OutputFormat,
     console,
+    export_console,
+    get_output_console,
     handle_atpack_error,
     handle_device_not_found_error,
+    load_atpack_summary,
+    write_json,
 )
 
 # Create devices sub-command app
 devices_app = typer.Typer(name="devices", help="🔌 Device information")
 
+# Likely PIC packages for a given pin count (PIC device files don't encode packages)
+_PIC_PIN_COUNT_PACKAGES: Dict[int, Tuple[str, ...]] = {
+    8: ("PDIP-8", "SOIC-8"),
+    14: ("PDIP-14", "SOIC-14"),
+    18: ("PDIP-18", "SOIC-18"),
+    20: ("PDIP-20", "SOIC-20"),
+    28: ("PDIP-28", "SOIC-28", "PLCC-28"),
+    40: ("PDIP-40", "PLCC-44", "TQFP-44"),
+    44: ("PLCC-44", "TQFP-44", "QFN-44"),
+    64: ("TQFP-64", "QFN-64"),
+    80: ("TQFP-80", "PQFP-80"),
+    100: ("TQFP-100", "PQFP-100"),
+}
+
+# ATMEL pad name patterns, checked in priority order (e.g. AVSS is power, not analog)
+_ATMEL_PIN_TYPE_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("power", re.compile(r"VCC|AVCC|GND|VSS")),
+    ("control", re.compile(r"RESET")),
+    ("oscillator", re.compile(r"XTAL|OSC")),
+    ("analog", re.compile(r"ADC|AREF|AVSS")),
+    ("programming", re.compile(r"PDI|UPDI|TDI|TDO|TMS|TCK")),
+)
+
 
+@lru_cache(maxsize=512)
 def _detect_atmel_pin_type(pad_name: str) -> str:
     """Detect ATMEL pin type based on pad name.
 
@@ -51,93 +96,144 @@ def _detect_atmel_pin_type(pad_name: str) -> str:
 
     pad_upper = pad_name.upper()
 
-    # Power pins
-    if any(power in pad_upper for power in ["VCC", "AVCC", "GND", "VSS"]):
-        return "power"
+    for pin_type, pattern in _ATMEL_PIN_TYPE_PATTERNS:
+        if pattern.search(pad_upper):
+            return pin_type
+
+    # Digital I/O pins (default for Port pins)
+    return "digital"
+
 
-    # Reset pins
-    if "RESET" in pad_upper:
-        return "control"
+class _PackageRow(NamedTuple):
+    """One row of the device package listing."""
 
-    # Oscillator/Crystal pins
-    if any(osc in pad_upper for osc in ["XTAL", "OSC"]):
-        return "oscillator"
+    package: str
+    pinout: str
+    order_code: str
+    temp_range: str
+    vcc_range: str
+    max_speed: str
 
-    # ADC/Analog pins
-    if any(analog in pad_upper for analog in ["ADC", "AREF", "AVSS"]):
-        return "analog"
 
-    # Programming/Debug pins
-    if any(prog in pad_upper for prog in ["PDI", "UPDI", "TDI", "TDO", "TMS", "TCK"]):
-        return "programming"
+class _PinRow(NamedTuple):
+    """One pin of a device pinout."""
+
+    package: str
+    position: str
+    pad: str
+    pin_type: str
+    functions: List[str]
+
+
+def _pin_position_key(pin: _PinRow) -> Tuple[int, Union[int, str]]:
+    """Sort key placing numeric pin positions first, then the rest alphabetically."""
+    position = pin.position
+    if position.isdecimal():
+        return (0, int(position))
+    return (1, position)
+
+
+def _write_csv(
+    fieldnames: Sequence[str], rows: Iterable[Sequence], output: Optional[Path]
+) -> None:
+    """Write a CSV header and rows straight to the output file, or stdout."""
+    if output:
+        with output.open("w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+    else:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
+
+def _format_pin_functions(functions: List[str], limit: int = 3) -> str:
+    """Join the first pin functions, noting how many more were left out."""
+    hidden = len(functions) - limit
+    if hidden > 0:
+        return f"{', '.join(functions[:limit])} (+{hidden} more)"
+    return ", ".join(functions)
+
+
+def _format_plain_table(
+    title: str, headers: Sequence[str], rows: Sequence[Sequence[str]]
+) -> List[str]:
+    """Format a table as plain text lines with space-padded columns."""
+    widths = [len(header) for header in headers]
+    for row in rows:
+        widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+
+    def format_row(cells: Sequence[str]) -> str:
+        return "  ".join(
+            cell.ljust(width) for cell, width in zip(cells, widths)
+        ).rstrip()
+
+    lines = [title, format_row(headers), format_row(["-" * w for w in widths])]
+    lines.extend(format_row(row) for row in rows)
+    return lines
 
-    # Digital I/O pins (default for Port pins)
-    return "digital"
+
+def _make_device_table(title: str, devices: List[str], no_color: bool) -> Table:
+    """Build the numbered device table shared by the list and search commands."""
+    styles = get_styles(no_color)
+    table = Table(title=title)
+    table.add_column("Device Name", style=styles["cyan"])
+    table.add_column("Index", style=styles["dim"])
+
+    for device, index in zip(devices, map(str, range(1, len(devices) + 1))):
+        table.add_row(device, index)
+
+    return table
 
 
 @devices_app.command("list")
 def list_devices(
     atpack_path: AtPackPath,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
-    ] = False,
+    format: OutputFormat = "table",
+    output: OutputFile = None,
+    no_color: NoColor = False,
 ):
     """📋 List all devices in an AtPack."""
     try:
-        parser = AtPackParser(atpack_path)
-        devices = parser.get_devices()
-        device_family = parser.device_family
+        _, device_family, devices = load_atpack_summary(atpack_path)
+        family_value = device_family.value
 
         data = {
-            "device_family": device_family.value,
+            "device_family": family_value,
             "device_count": len(devices),
             "devices": devices,
         }
 
         if format == "json":
-            json_output = json.dumps(data, indent=2)
+            write_json(data, output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported {len(devices)} devices to {output}[/green]"
                 )
-            else:
-                print(json_output)
         else:
             # Create console with color control
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            output_console = get_output_console(no_color)
 
             # Format family display with emoji
             family_display = (
                 format_family_display(device_family, include_name=True)
                 if not no_color
-                else f"[{device_family.value}]"
+                else f"[{family_value}]"
             )
 
-            table = Table(title=f"{family_display} Devices in {atpack_path.name}")
-            table.add_column("Device Name", style="cyan" if not no_color else None)
-            table.add_column("Index", style="dim" if not no_color else None)
-
-            for i, device in enumerate(devices, 1):
-                table.add_row(device, str(i))
+            table = _make_device_table(
+                f"{family_display} Devices in {atpack_path.name}", devices, no_color
+            )
 
             if output:
                 # Export table as text
-                with output_console.capture() as capture:
-                    output_console.print(table)
-                    output_console.print(f"\nTotal: {len(devices)} devices")
+                with export_console(
+                    output, no_color, output_console.width
+                ) as file_console:
+                    file_console.print(table)
+                    file_console.print(f"\nTotal: {len(devices)} devices")
 
-                output.write_text(capture.get(), encoding="utf-8")
                 console.print(
                     f"[green]Exported {len(devices)} devices to {output}[/green]"
                 )
@@ -157,9 +253,7 @@ def list_devices(
 def device_info(
     device_name: DeviceName,
     atpack_path: AtPackPath,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
 ):
     """ℹ️ Show detailed information for a specific device."""
     try:
@@ -197,7 +291,7 @@ def device_info(
                 memory_table.add_column("Size", style="yellow")
                 memory_table.add_column("Type", style="magenta")
 
-                for seg in sorted(device.memory_segments, key=lambda x: x.start):
+                for seg in sorted(device.memory_segments, key=attrgetter("start")):
                     end_addr = seg.start + seg.size - 1
                     memory_table.add_row(
                         seg.name,
@@ -217,9 +311,10 @@ def device_info(
                 module_table.add_column("Total Registers", style="yellow")
 
                 for module in device.modules:
-                    total_regs = sum(len(rg.registers) for rg in module.register_groups)
                     module_table.add_row(
-                        module.name, str(len(module.register_groups)), str(total_regs)
+                        module.name,
+                        str(len(module.register_groups)),
+                        str(module.total_registers),
                     )
 
                 console.print(module_table)
@@ -236,28 +331,28 @@ def search_devices(
         str, typer.Argument(help="Search pattern (supports wildcards * and ?)")
     ],
     atpack_path: AtPackPath,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
-    ] = False,
+    format: OutputFormat = "table",
+    output: OutputFile = None,
+    no_color: NoColor = False,
 ):
     """🔍 Search for devices by name pattern (supports * and ? wildcards)."""
     try:
         parser = AtPackParser(atpack_path)
         all_devices = parser.get_devices()
         device_family = parser.device_family
-
-        # Filter devices using pattern matching
-        matching_devices = [
-            device
-            for device in all_devices
-            if fnmatch.fnmatch(device.upper(), pattern.upper())
-        ]
+        family_value = device_family.value
+
+        # Filter devices using pattern matching (plain names skip the glob machinery)
+        pattern_upper = pattern.upper()
+        if any(char in pattern for char in "*?["):
+            match = re.compile(fnmatch.translate(pattern_upper)).match
+            matching_devices = [
+                device for device in all_devices if match(device.upper())
+            ]
+        else:
+            matching_devices = [
+                device for device in all_devices if device.upper() == pattern_upper
+            ]
 
         if not matching_devices:
             console.print(
@@ -268,52 +363,45 @@ def search_devices(
 
         data = {
             "search_pattern": pattern,
-            "device_family": device_family.value,
+            "device_family": family_value,
             "total_devices": len(all_devices),
             "matching_count": len(matching_devices),
             "matching_devices": matching_devices,
         }
 
         if format == "json":
-            json_output = json.dumps(data, indent=2)
+            write_json(data, output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported {len(matching_devices)} matching devices to {output}[/green]"
                 )
-            else:
-                print(json_output)
         else:
             # Create console with color control
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            output_console = get_output_console(no_color)
 
             # Format family display with emoji
             family_display = (
                 format_family_display(device_family, include_name=True)
                 if not no_color
-                else f"[{device_family.value}]"
+                else f"[{family_value}]"
             )
 
-            table = Table(title=f"{family_display} Devices matching '{pattern}'")
-            table.add_column("Device Name", style="cyan" if not no_color else None)
-            table.add_column("Index", style="dim" if not no_color else None)
-
-            for i, device in enumerate(matching_devices, 1):
-                table.add_row(device, str(i))
+            table = _make_device_table(
+                f"{family_display} Devices matching '{pattern}'",
+                matching_devices,
+                no_color,
+            )
 
             if output:
                 # Export table as text
-                with output_console.capture() as capture:
-                    output_console.print(table)
-                    output_console.print(
+                with export_console(
+                    output, no_color, output_console.width
+                ) as file_console:
+                    file_console.print(table)
+                    file_console.print(
                         f"\nMatching: {len(matching_devices)}/{len(all_devices)} devices"
                     )
 
-                output.write_text(capture.get(), encoding="utf-8")
                 console.print(
                     f"[green]Exported {len(matching_devices)} matching devices to {output}[/green]"
                 )
@@ -337,20 +425,17 @@ def list_packages(
     format: Annotated[
         str, typer.Option("--format", "-f", help="Output format (table, json, csv)")
     ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
-    ] = False,
+    output: OutputFile = None,
+    no_color: NoColor = False,
 ):
     """📦 List all packages/variants available for a device."""
     try:
         parser = AtPackParser(atpack_path)
         device = parser.get_device(device_name)
         device_family = parser.device_family
+        family_value = device_family.value
 
-        package_data = []
+        package_data: List[_PackageRow] = []
 
         if device_family == DeviceFamily.ATMEL:
             # Handle ATMEL package variants
@@ -376,28 +461,28 @@ def list_packages(
                         max_speed = format_frequency(f"{variant.speed_max} Hz")
 
                     package_data.append(
-                        {
-                            "package": variant.package,
-                            "pinout": variant.pinout,
-                            "order_code": variant.order_code or "N/A",
-                            "temp_range": temp_range,
-                            "vcc_range": vcc_range,
-                            "max_speed": max_speed,
-                        }
+                        _PackageRow(
+                            package=variant.package,
+                            pinout=variant.pinout,
+                            order_code=variant.order_code or "N/A",
+                            temp_range=temp_range,
+                            vcc_range=vcc_range,
+                            max_speed=max_speed,
+                        )
                     )
 
             # Also check for pinout packages if no package variants are available
             if not package_data and device.atmel_pinouts:
                 for pinout in device.atmel_pinouts:
                     package_data.append(
-                        {
-                            "package": pinout.name,
-                            "pinout": pinout.name,
-                            "order_code": "N/A",
-                            "temp_range": "N/A",
-                            "vcc_range": "N/A",
-                            "max_speed": "N/A",
-                        }
+                        _PackageRow(
+                            package=pinout.name,
+                            pinout=pinout.name,
+                            order_code="N/A",
+                            temp_range="N/A",
+                            vcc_range="N/A",
+                            max_speed="N/A",
+                        )
                     )
 
         elif device_family == DeviceFamily.PIC:
@@ -406,29 +491,7 @@ def list_packages(
             pin_count = len(device.pinout) if device.pinout else 0
 
             # Common PIC package mappings based on pin count
-            common_packages = []
-            if pin_count == 8:
-                common_packages = ["PDIP-8", "SOIC-8"]
-            elif pin_count == 14:
-                common_packages = ["PDIP-14", "SOIC-14"]
-            elif pin_count == 18:
-                common_packages = ["PDIP-18", "SOIC-18"]
-            elif pin_count == 20:
-                common_packages = ["PDIP-20", "SOIC-20"]
-            elif pin_count == 28:
-                common_packages = ["PDIP-28", "SOIC-28", "PLCC-28"]
-            elif pin_count == 40:
-                common_packages = ["PDIP-40", "PLCC-44", "TQFP-44"]
-            elif pin_count == 44:
-                common_packages = ["PLCC-44", "TQFP-44", "QFN-44"]
-            elif pin_count == 64:
-                common_packages = ["TQFP-64", "QFN-64"]
-            elif pin_count == 80:
-                common_packages = ["TQFP-80", "PQFP-80"]
-            elif pin_count == 100:
-                common_packages = ["TQFP-100", "PQFP-100"]
-            else:
-                common_packages = ["Unknown"]
+            common_packages = _PIC_PIN_COUNT_PACKAGES.get(pin_count, ())
 
             # Get device specifications using configuration-based approach
             vdd_range = "N/A"
@@ -452,41 +515,39 @@ def list_packages(
                 max_freq = get_device_default_frequency(device_name)
 
             # For PIC devices, create entries for each likely package type
-            if common_packages and common_packages != ["Unknown"]:
+            if common_packages:
                 for pkg in common_packages:
                     package_data.append(
-                        {
-                            "package": f"{pkg}(1)",
-                            "pinout": f"{pin_count}-pin",
-                            "order_code": f"{device_name}-{pkg.replace('-', '')}(1)",
-                            "temp_range": (
+                        _PackageRow(
+                            package=f"{pkg}(1)",
+                            pinout=f"{pin_count}-pin",
+                            order_code=f"{device_name}-{pkg.replace('-', '')}(1)",
+                            temp_range=(
                                 f"{temp_range}(2)"
                                 if temp_range != "N/A"
                                 else temp_range
                             ),
-                            "vcc_range": vdd_range,
-                            "max_speed": (
+                            vcc_range=vdd_range,
+                            max_speed=(
                                 f"{max_freq}(2)" if max_freq != "N/A" else max_freq
                             ),
-                        }
+                        )
                     )
             else:
                 # Fallback to single default entry
                 package_data.append(
-                    {
-                        "package": (
+                    _PackageRow(
+                        package=(
                             f"{pin_count}-pin(1)" if pin_count > 0 else "Unknown(1)"
                         ),
-                        "pinout": f"{pin_count}-pin",
-                        "order_code": f"{device_name}-(1)",
-                        "temp_range": (
+                        pinout=f"{pin_count}-pin",
+                        order_code=f"{device_name}-(1)",
+                        temp_range=(
                             f"{temp_range}(2)" if temp_range != "N/A" else temp_range
                         ),
-                        "vcc_range": vdd_range,
-                        "max_speed": (
-                            f"{max_freq}(2)" if max_freq != "N/A" else max_freq
-                        ),
-                    }
+                        vcc_range=vdd_range,
+                        max_speed=(f"{max_freq}(2)" if max_freq != "N/A" else max_freq),
+                    )
                 )
         else:
             console.print(f"[red]Unsupported device family: {device_family}[/red]")
@@ -502,97 +563,61 @@ def list_packages(
         if format == "json":
             output_data = {
                 "device": device_name,
-                "family": device_family.value,
+                "family": family_value,
                 "package_count": len(package_data),
-                "packages": package_data,
+                "packages": [package._asdict() for package in package_data],
             }
 
-            json_output = json.dumps(output_data, indent=2)
+            write_json(output_data, output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported package list for {device_name} to {output}[/green]"
                 )
-            else:
-                print(json_output)
 
         elif format == "csv":
-            import csv
-            import io
-
-            csv_output = io.StringIO()
-            fieldnames = [
-                "package",
-                "pinout",
-                "order_code",
-                "temp_range",
-                "vcc_range",
-                "max_speed",
-            ]
-
-            writer = csv.DictWriter(csv_output, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for package in package_data:
-                writer.writerow(package)
-
-            csv_text = csv_output.getvalue()
+            _write_csv(_PackageRow._fields, package_data, output)
             if output:
-                output.write_text(csv_text, encoding="utf-8")
                 console.print(
                     f"[green]Exported package list for {device_name} to {output}[/green]"
                 )
-            else:
-                print(csv_text)
 
         else:  # table format
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            output_console = get_output_console(no_color)
+            styles = get_styles(no_color)
 
             # Format family display with emoji
             family_emoji = (
-                get_family_emoji(device_family)
-                if not no_color
-                else f"[{device_family.value}]"
+                get_family_emoji(device_family) if not no_color else f"[{family_value}]"
             )
             title = f"📦 {family_emoji} {device_name} Packages"
 
             table = Table(title=title)
-            table.add_column("Package", style="cyan" if not no_color else None)
-            table.add_column("Pinout", style="green" if not no_color else None)
-            table.add_column("Order Code", style="yellow" if not no_color else None)
-            table.add_column("Temperature", style="blue" if not no_color else None)
-            table.add_column("VCC Range", style="magenta" if not no_color else None)
-            table.add_column("Max Speed", style="red" if not no_color else None)
+            table.add_column("Package", style=styles["cyan"])
+            table.add_column("Pinout", style=styles["green"])
+            table.add_column("Order Code", style=styles["yellow"])
+            table.add_column("Temperature", style=styles["blue"])
+            table.add_column("VCC Range", style=styles["magenta"])
+            table.add_column("Max Speed", style=styles["red"])
 
             for package in package_data:
-                table.add_row(
-                    package["package"],
-                    package["pinout"],
-                    package["order_code"],
-                    package["temp_range"],
-                    package["vcc_range"],
-                    package["max_speed"],
-                )
+                table.add_row(*package)
 
             if output:
-                with output_console.capture() as capture:
-                    output_console.print(table)
-                    output_console.print(f"\nTotal packages: {len(package_data)}")
+                with export_console(
+                    output, no_color, output_console.width
+                ) as file_console:
+                    file_console.print(table)
+                    file_console.print(f"\nTotal packages: {len(package_data)}")
 
                     # Add footnotes for PIC devices
                     if device_family == DeviceFamily.PIC:
-                        output_console.print(
+                        file_console.print(
                             "(1) Package information inferred from pin count (not explicitly defined in AtPack file)"
                         )
-                        output_console.print(
+                        file_console.print(
                             "(2) Data derived from internal device specifications database pic_device_specs.json (not explicitly defined in AtPack file)"
                         )
 
-                output.write_text(capture.get(), encoding="utf-8")
                 console.print(
                     f"[green]Exported package list for {device_name} to {output}[/green]"
                 )
@@ -627,12 +652,8 @@ def show_pinout(
     format: Annotated[
         str, typer.Option("--format", "-f", help="Output format (table, json, csv)")
     ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
-    ] = False,
+    output: OutputFile = None,
+    no_color: NoColor = False,
     package: Annotated[
         Optional[str],
         typer.Option("--package", "-p", help="Specific package/pinout to show"),
@@ -646,9 +667,10 @@ def show_pinout(
         parser = AtPackParser(atpack_path)
         device = parser.get_device(device_name)
         device_family = parser.device_family
+        family_value = device_family.value
 
         # Prepare pinout data based on device family, grouped by package
-        packages_pinout_data = {}
+        packages_pinout_data: Dict[str, List[_PinRow]] = {}
 
         if device_family == DeviceFamily.ATMEL:
             # Handle ATMEL pinouts
@@ -666,13 +688,13 @@ def show_pinout(
                         pin_type = _detect_atmel_pin_type(pad_name)
 
                         packages_pinout_data[package_name].append(
-                            {
-                                "package": package_name,
-                                "position": pin.get("position", ""),
-                                "pad": pad_name,
-                                "pin_type": pin_type,
-                                "functions": [],  # ATMEL functions would need additional parsing
-                            }
+                            _PinRow(
+                                package=package_name,
+                                position=pin.get("position", ""),
+                                pad=pad_name,
+                                pin_type=pin_type,
+                                functions=[],  # ATMEL functions would need additional parsing
+                            )
                         )
             else:
                 console.print(
@@ -692,17 +714,17 @@ def show_pinout(
                         functions = [f.name for f in pin_info.alternative_functions]
 
                     packages_pinout_data[package_name].append(
-                        {
-                            "package": package_name,
-                            "position": (
+                        _PinRow(
+                            package=package_name,
+                            position=(
                                 str(pin_info.physical_pin)
                                 if pin_info.physical_pin
                                 else ""
                             ),
-                            "pad": pin_info.primary_function or "",
-                            "pin_type": pin_info.pin_type or "Unknown",
-                            "functions": functions,
-                        }
+                            pad=pin_info.primary_function or "",
+                            pin_type=pin_info.pin_type or "Unknown",
+                            functions=functions,
+                        )
                     )
             else:
                 console.print(
@@ -728,198 +750,159 @@ def show_pinout(
         if format == "json":
             output_data = {
                 "device": device_name,
-                "family": device_family.value,
+                "family": family_value,
                 "package_filter": package,
                 "total_pins": len(all_pinout_data),
-                "packages": packages_pinout_data,
+                "packages": {
+                    pkg_name: [pin._asdict() for pin in pins]
+                    for pkg_name, pins in packages_pinout_data.items()
+                },
             }
 
-            json_output = json.dumps(output_data, indent=2)
+            write_json(output_data, output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported pinout for {device_name} to {output}[/green]"
                 )
-            else:
-                print(json_output)
 
         elif format == "csv":
-            import csv
-            import io
-
-            csv_output = io.StringIO()
-            fieldnames = ["package", "position", "pad", "pin_type"]
             if show_functions:
-                fieldnames.append("functions")
-
-            writer = csv.DictWriter(csv_output, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for pin in all_pinout_data:
-                row = {
-                    "package": pin["package"],
-                    "position": pin["position"],
-                    "pad": pin["pad"],
-                    "pin_type": pin["pin_type"],
-                }
-                if show_functions:
-                    row["functions"] = (
-                        ", ".join(pin["functions"]) if pin["functions"] else ""
-                    )
-                writer.writerow(row)
+                fieldnames = _PinRow._fields
+                rows = (
+                    pin._replace(functions=", ".join(pin.functions))
+                    for pin in all_pinout_data
+                )
+            else:
+                fieldnames = _PinRow._fields[:-1]
+                rows = (pin[:-1] for pin in all_pinout_data)
 
-            csv_text = csv_output.getvalue()
+            _write_csv(fieldnames, rows, output)
             if output:
-                output.write_text(csv_text, encoding="utf-8")
                 console.print(
                     f"[green]Exported pinout for {device_name} to {output}[/green]"
                 )
-            else:
-                print(csv_text)
 
         else:  # table format
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
-
             # Format family display with emoji
             family_emoji = (
-                get_family_emoji(device_family)
-                if not no_color
-                else f"[{device_family.value}]"
+                get_family_emoji(device_family) if not no_color else f"[{family_value}]"
             )
 
-            # Output each package separately for better readability
+            headers = ["Pin", "Pad/Function", "Type"]
+            if show_functions:
+                headers.append("Alt Functions")
+
+            # Build the rows of each package once, sorted by position if
+            # numeric, otherwise alphabetically
+            package_rows = []
             for pkg_name, pinout_data in packages_pinout_data.items():
-                title = f"📌 {family_emoji} {device_name} - {pkg_name}"
+                rows = []
+                for pin in sorted(pinout_data, key=_pin_position_key):
+                    row = [pin.position, pin.pad, pin.pin_type]
 
-                table = Table(title=title)
-                table.add_column(
-                    "Pin", style="cyan" if not no_color else None, min_width=4
-                )
-                table.add_column(
-                    "Pad/Function", style="green" if not no_color else None
-                )
-                table.add_column("Type", style="yellow" if not no_color else None)
+                    if show_functions:
+                        row.append(_format_pin_functions(pin.functions))
 
-                if show_functions:
-                    table.add_column(
-                        "Alt Functions", style="blue" if not no_color else None
-                    )
+                    rows.append(row)
 
-                # Sort by position if numeric, otherwise alphabetically
-                try:
-                    pinout_data_sorted = sorted(
-                        pinout_data,
-                        key=lambda x: (
-                            int(x["position"]) if x["position"].isdigit() else 999
-                        ),
+                package_rows.append(
+                    (
+                        f"📌 {family_emoji} {device_name} - {pkg_name}",
+                        rows,
+                        f"Package {pkg_name}: {len(pinout_data)} pins",
                     )
-                except (ValueError, TypeError):
-                    pinout_data_sorted = sorted(
-                        pinout_data, key=lambda x: x["position"]
+                )
+
+            multiple_packages = len(package_rows) > 1
+
+            # Summary
+            total_packages = len(packages_pinout_data)
+            total_pins = len(all_pinout_data)
+
+            summary_msg = f"Total: {total_packages} package{'s' if total_packages != 1 else ''}, {total_pins} pin{'s' if total_pins != 1 else ''}"
+            atmel_note = "Note: Pin types for ATMEL devices are inferred from pad names using heuristic pattern matching."
+
+            if no_color:
+                # Plain aligned text, bypassing Rich style and box rendering
+                lines = []
+                for title, rows, package_msg in package_rows:
+                    lines.extend(_format_plain_table(title, headers, rows))
+                    lines.append(package_msg)
+
+                    # Add spacing between packages if showing multiple
+                    if multiple_packages:
+                        lines.append("")
+
+                lines.append(summary_msg)
+
+                # Add explanatory note for ATMEL devices
+                if device_family == DeviceFamily.ATMEL:
+                    lines.append(atmel_note)
+
+                text = "\n".join(lines) + "\n"
+                sys.stdout.write(text)
+
+                if output:
+                    output.write_text(text, encoding="utf-8")
+                    console.print(
+                        f"[green]Exported pinout for {device_name} to {output}[/green]"
                     )
+                return
 
-                for pin in pinout_data_sorted:
-                    row = [pin["position"], pin["pad"], pin["pin_type"]]
+            output_console = get_output_console()
+            column_styles = ["cyan", "green", "yellow", "blue"]
 
-                    if show_functions:
-                        functions_str = ", ".join(
-                            pin["functions"][:3]
-                        )  # Limit to first 3 functions
-                        if len(pin["functions"]) > 3:
-                            functions_str += f" (+{len(pin['functions']) - 3} more)"
-                        row.append(functions_str)
+            # Build each package table once so the file export can reuse it
+            package_tables = []
+            for title, rows, package_msg in package_rows:
+                table = Table(title=title)
+                for header, style in zip(headers, column_styles):
+                    table.add_column(
+                        header, style=style, min_width=4 if header == "Pin" else None
+                    )
 
+                for row in rows:
                     table.add_row(*row)
 
+                package_tables.append((table, package_msg))
+
+            # Output each package separately for better readability
+            for table, package_msg in package_tables:
                 output_console.print(table)
-                output_console.print(
-                    f"[green]Package {pkg_name}: {len(pinout_data)} pins[/green]"
-                    if not no_color
-                    else f"Package {pkg_name}: {len(pinout_data)} pins"
-                )
+                output_console.print(f"[green]{package_msg}[/green]")
 
                 # Add spacing between packages if showing multiple
-                if len(packages_pinout_data) > 1:
+                if multiple_packages:
                     output_console.print()
 
-            # Summary
-            total_packages = len(packages_pinout_data)
-            total_pins = len(all_pinout_data)
-
-            summary_msg = f"Total: {total_packages} package{'s' if total_packages != 1 else ''}, {total_pins} pin{'s' if total_pins != 1 else ''}"
-            output_console.print(
-                f"[bold green]{summary_msg}[/bold green]"
-                if not no_color
-                else summary_msg
-            )
+            output_console.print(f"[bold green]{summary_msg}[/bold green]")
 
             # Add explanatory note for ATMEL devices
             if device_family == DeviceFamily.ATMEL:
-                atmel_note = "Note: Pin types for ATMEL devices are inferred from pad names using heuristic pattern matching."
-                output_console.print(
-                    f"[dim]{atmel_note}[/dim]" if not no_color else atmel_note
-                )
+                output_console.print(f"[dim]{atmel_note}[/dim]")
 
             if output:
-                with output_console.capture() as capture:
-                    # Re-capture all output for file export
-                    for pkg_name, pinout_data in packages_pinout_data.items():
-                        title = f"📌 {family_emoji} {device_name} - {pkg_name}"
-                        table = Table(title=title)
-                        table.add_column("Pin", min_width=4)
-                        table.add_column("Pad/Function")
-                        table.add_column("Type")
-
-                        if show_functions:
-                            table.add_column("Alt Functions")
-
-                        try:
-                            pinout_data_sorted = sorted(
-                                pinout_data,
-                                key=lambda x: (
-                                    int(x["position"])
-                                    if x["position"].isdigit()
-                                    else 999
-                                ),
-                            )
-                        except (ValueError, TypeError):
-                            pinout_data_sorted = sorted(
-                                pinout_data, key=lambda x: x["position"]
-                            )
-
-                        for pin in pinout_data_sorted:
-                            row = [pin["position"], pin["pad"], pin["pin_type"]]
-
-                            if show_functions:
-                                functions_str = ", ".join(pin["functions"][:3])
-                                if len(pin["functions"]) > 3:
-                                    functions_str += (
-                                        f" (+{len(pin['functions']) - 3} more)"
-                                    )
-                                row.append(functions_str)
-
-                            table.add_row(*row)
-
-                        output_console.print(table)
-                        output_console.print(
-                            f"Package {pkg_name}: {len(pinout_data)} pins"
-                        )
-                        if len(packages_pinout_data) > 1:
-                            output_console.print()
-
-                    output_console.print(summary_msg)
+                # Replay the already built tables for file export, whose
+                # cells are written without the column colors
+                for table, _ in package_tables:
+                    for column in table.columns:
+                        column.style = ""
+
+                with export_console(
+                    output, no_color, output_console.width
+                ) as file_console:
+                    for table, package_msg in package_tables:
+                        file_console.print(table)
+                        file_console.print(package_msg)
+                        if multiple_packages:
+                            file_console.print()
+
+                    file_console.print(summary_msg)
 
                     # Add explanatory note for ATMEL devices in export
                     if device_family == DeviceFamily.ATMEL:
-                        output_console.print(
-                            "Note: Pin types for ATMEL devices are inferred from pad names using heuristic pattern matching."
-                        )
+                        file_console.print(atmel_note)
 
-                output.write_text(capture.get(), encoding="utf-8")
                 console.print(
                     f"[green]Exported pinout for {device_name} to {output}[/green]"
                 )
@@ -937,12 +920,8 @@ def device_specs(
     format: Annotated[
         str, typer.Option("--format", "-f", help="Output format (table, json, csv)")
     ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
-    ] = False,
+    output: OutputFile = None,
+    no_color: NoColor = False,
     show_gpr: Annotated[
         bool, typer.Option("--show-gpr", help="Show detailed GPR sector information")
     ] = False,
@@ -951,11 +930,12 @@ def device_specs(
     try:
         parser = AtPackParser(atpack_path)
         device_family = parser.device_family
+        family_value = device_family.value
 
         # Check if specs extraction is supported
         if device_family != DeviceFamily.PIC:
             console.print(
-                f"[red]Device specifications extraction is currently only supported for PIC devices, not {device_family.value}[/red]"
+                f"[red]Device specifications extraction is currently only supported for PIC devices, not {family_value}[/red]"
             )
             return
 
@@ -966,21 +946,14 @@ def device_specs(
         if format == "json":
             output_data = specs.model_dump()
 
-            json_output = json.dumps(output_data, indent=2)
+            write_json(output_data, output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported device specifications for {device_name} to {output}[/green]"
                 )
-            else:
-                print(json_output)
 
         elif format == "csv":
-            import csv
-            import io
-
-            csv_output = io.StringIO()
-            fieldnames = [
+            fieldnames = (
                 "device_name",
                 "f_cpu",
                 "maximum_ram_size",
@@ -992,60 +965,29 @@ def device_specs(
                 "gpr_total_size",
                 "architecture",
                 "series",
-            ]
-
-            writer = csv.DictWriter(csv_output, fieldnames=fieldnames)
-            writer.writeheader()
-
-            # Convert specs to dict for CSV
-            row = {
-                "device_name": specs.device_name,
-                "f_cpu": specs.f_cpu,
-                "maximum_ram_size": specs.maximum_ram_size,
-                "maximum_size": specs.maximum_size,
-                "eeprom_addr": specs.eeprom_addr,
-                "eeprom_size": specs.eeprom_size,
-                "config_addr": specs.config_addr,
-                "config_size": specs.config_size,
-                "gpr_total_size": specs.gpr_total_size,
-                "architecture": specs.architecture,
-                "series": specs.series,
-            }
-            writer.writerow(row)
+            )
 
-            csv_text = csv_output.getvalue()
+            _write_csv(fieldnames, [attrgetter(*fieldnames)(specs)], output)
             if output:
-                output.write_text(csv_text, encoding="utf-8")
                 console.print(
                     f"[green]Exported device specifications for {device_name} to {output}[/green]"
                 )
-            else:
-                print(csv_text)
 
         else:  # table format
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            output_console = get_output_console(no_color)
+            styles = get_styles(no_color)
 
             # Format family display with emoji
             family_emoji = (
-                get_family_emoji(device_family)
-                if not no_color
-                else f"[{device_family.value}]"
+                get_family_emoji(device_family) if not no_color else f"[{family_value}]"
             )
             title = f"📊 {family_emoji} {device_name} Device Specifications"
 
             # Main specifications table
             specs_table = Table(title=title)
-            specs_table.add_column(
-                "Specification", style="cyan" if not no_color else None
-            )
-            specs_table.add_column("Value", style="green" if not no_color else None)
-            specs_table.add_column(
-                "Unit/Notes", style="yellow" if not no_color else None
-            )
+            specs_table.add_column("Specification", style=styles["cyan"])
+            specs_table.add_column("Value", style=styles["green"])
+            specs_table.add_column("Unit/Notes", style=styles["yellow"])
 
             # Add basic specifications
             specs_table.add_row("Device Name", specs.device_name, "")
@@ -1077,19 +1019,16 @@ def device_specs(
             output_console.print(specs_table)
 
             # GPR details table (if requested)
+            gpr_table = None
             if show_gpr and specs.gpr_sectors:
                 gpr_table = Table(
                     title=f"🏦 GPR Memory Banks ({len(specs.gpr_sectors)} sectors)"
                 )
-                gpr_table.add_column("Bank", style="cyan" if not no_color else None)
-                gpr_table.add_column("Name", style="green" if not no_color else None)
-                gpr_table.add_column(
-                    "Start Address", style="yellow" if not no_color else None
-                )
-                gpr_table.add_column(
-                    "End Address", style="yellow" if not no_color else None
-                )
-                gpr_table.add_column("Size", style="magenta" if not no_color else None)
+                gpr_table.add_column("Bank", style=styles["cyan"])
+                gpr_table.add_column("Name", style=styles["green"])
+                gpr_table.add_column("Start Address", style=styles["yellow"])
+                gpr_table.add_column("End Address", style=styles["yellow"])
+                gpr_table.add_column("Size", style=styles["magenta"])
 
                 for sector in specs.gpr_sectors:
                     gpr_table.add_row(
@@ -1111,38 +1050,28 @@ def device_specs(
             output_console.print(note_msg)
 
             if output:
-                with output_console.capture() as capture:
-                    # Re-capture all output for file export
-                    output_console.print(specs_table)
-
-                    if show_gpr and specs.gpr_sectors:
-                        gpr_table = Table(
-                            title=f"GPR Memory Banks ({len(specs.gpr_sectors)} sectors)"
+                with export_console(
+                    output, no_color, output_console.width
+                ) as file_console:
+                    # Replay the already built tables for file export
+                    file_console.print(specs_table)
+
+                    if gpr_table is not None:
+                        # The export has no emoji title and no column colors
+                        gpr_table.title = (
+                            f"GPR Memory Banks ({len(specs.gpr_sectors)} sectors)"
                         )
-                        gpr_table.add_column("Bank")
-                        gpr_table.add_column("Name")
-                        gpr_table.add_column("Start Address")
-                        gpr_table.add_column("End Address")
-                        gpr_table.add_column("Size")
-
-                        for sector in specs.gpr_sectors:
-                            gpr_table.add_row(
-                                sector.bank or "N/A",
-                                sector.name,
-                                f"0x{sector.start_addr:04X}",
-                                f"0x{sector.end_addr:04X}",
-                                f"{sector.size} bytes",
-                            )
+                        for column in gpr_table.columns:
+                            column.style = ""
 
-                        output_console.print()
-                        output_console.print(gpr_table)
+                        file_console.print()
+                        file_console.print(gpr_table)
 
-                    output_console.print()
-                    output_console.print(
+                    file_console.print()
+                    file_console.print(
                         "Note: Specifications extracted from AtPack file using shadowidref-aware parsing to avoid double-counting memory regions."
                     )
 
-                output.write_text(capture.get(), encoding="utf-8")
                 console.print(
                     f"[green]Exported device specifications for {device_name} to {output}[/green]"
                 )
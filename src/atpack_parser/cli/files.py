@@ -1,9 +1,10 @@
 """Files command group for AtPack CLI."""
 
-import json
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, List, Optional
 
 import typer
 from rich.panel import Panel
@@ -11,43 +12,95 @@ from rich.table import Table
 
 from .. import AtPackParser
 from ..exceptions import AtPackError
-from .common import AtPackPath, console, handle_atpack_error
+from .common import (
+    AtPackPath,
+    OutputFormat,
+    console,
+    handle_atpack_error,
+    write_json,
+)
 
 # Create files sub-command app
 files_app = typer.Typer(name="files", help="📁 AtPack file management")
 
 
+def _member_path(info: zipfile.ZipInfo, outdir: Path) -> str:
+    """Path a zip member is extracted to, sanitized like ZipFile.extract() does."""
+    arcname = info.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    arcname = os.path.sep.join(
+        part
+        for part in arcname.split(os.path.sep)
+        if part not in ("", os.path.curdir, os.path.pardir)
+    )
+    if os.path.sep == "\\":
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.normpath(os.path.join(outdir, arcname))
+
+
+def _extract_members(
+    zf: zipfile.ZipFile, outdir: Path, infos: List[zipfile.ZipInfo]
+) -> None:
+    """Extract members of an open zip archive with a pool of threads."""
+    # Create every directory on this thread so workers never race on makedirs
+    file_infos = []
+    for info in infos:
+        target = _member_path(info, outdir)
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            file_infos.append(info)
+
+    workers = min(os.cpu_count() or 1, len(file_infos))
+    if workers <= 1:
+        for info in file_infos:
+            zf.extract(info, outdir)
+        return
+
+    # Reads of a shared ZipFile are serialized on its lock, decompression is not
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda info: zf.extract(info, outdir), file_infos))
+
+
 @files_app.command("list")
 def list_files(
     atpack_path: AtPackPath,
     pattern: Annotated[
-        Optional[str], typer.Option("--pattern", "-p", help="File pattern filter")
+        Optional[str],
+        typer.Option(
+            "--pattern",
+            "-p",
+            help="File path filter, a substring or a glob like 'atdf/*.atdf'",
+        ),
     ] = None,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
+    show_size: Annotated[
+        bool, typer.Option("--size/--no-size", help="Show a table with file sizes")
+    ] = False,
 ):
     """📁 List files in an AtPack."""
     try:
-        parser = AtPackParser(atpack_path)
-        files = parser.list_files(pattern)
+        with AtPackParser(atpack_path) as parser:
+            if format == "json":
+                write_json(parser.list_files(pattern))
+            elif not show_size:
+                # One path per line, easy to pipe into other tools
+                files = parser.list_files(pattern)
+                if files:
+                    print("\n".join(files))
+            else:
+                table = Table(title=f"Files in {atpack_path.name}")
+                table.add_column("File Path", style="cyan")
+                table.add_column("Size", style="green")
 
-        if format == "json":
-            print(json.dumps(files, indent=2))
-        else:
-            table = Table(title=f"Files in {atpack_path.name}")
-            table.add_column("File Path", style="cyan")
-            table.add_column("Size", style="green")
-
-            for file_path in files:
-                try:
-                    content = parser.read_file(file_path)
-                    size = len(content.encode("utf-8"))
+                # Sizes come from archive metadata, file contents are never read
+                for file_path, size in parser.file_sizes(pattern).items():
                     table.add_row(file_path, f"{size:,} bytes")
-                except Exception:
-                    table.add_row(file_path, "Unknown")
 
-            console.print(table)
+                console.print(table)
 
     except AtPackError as e:
         handle_atpack_error(e)
@@ -57,29 +110,31 @@ def list_files(
 def file_info(atpack_path: AtPackPath):
     """ℹ️ Show AtPack file information."""
     try:
-        parser = AtPackParser(atpack_path)
-        metadata = parser.metadata
-        device_family = parser.device_family
+        with AtPackParser(atpack_path) as parser:
+            metadata = parser.metadata
+            device_family = parser.device_family
 
-        # Create info panel
-        info_text = f"""
+            # Create info panel
+            info_text = f"""
 [bold]Name:[/bold] {metadata.name}
 [bold]Vendor:[/bold] {metadata.vendor}
 [bold]Version:[/bold] {metadata.version}
 [bold]Device Family:[/bold] {device_family.value}
 [bold]Description:[/bold] {metadata.description or "N/A"}
 [bold]URL:[/bold] {metadata.url or "N/A"}
-        """.strip()
+            """.strip()
 
-        panel = Panel(info_text, title="📦 AtPack Information", border_style="blue")
-        console.print(panel)
+            panel = Panel(info_text, title="📦 AtPack Information", border_style="blue")
+            console.print(panel)
 
-        # Show device count
-        try:
-            devices = parser.get_devices()
-            console.print(f"\n[green]Found {len(devices)} devices[/green]")
-        except Exception as e:
-            console.print(f"\n[yellow]Warning: Could not count devices: {e}[/yellow]")
+            # Show device count
+            try:
+                devices = parser.get_devices()
+                console.print(f"\n[green]Found {len(devices)} devices[/green]")
+            except Exception as e:
+                console.print(
+                    f"\n[yellow]Warning: Could not count devices: {e}[/yellow]"
+                )
 
     except AtPackError as e:
         handle_atpack_error(e)
@@ -134,20 +189,19 @@ def extract_atpack(
         with zipfile.ZipFile(atpack_path, "r") as zf:
             console.print(f"[blue]Extracting {atpack_path} to {outdir}[/blue]")
 
-            # Get list of files to extract
-            file_list = zf.namelist()
+            # Get list of files to extract, with their total size
+            infos = zf.infolist()
+            file_infos = [info for info in infos if not info.is_dir()]
+            total_size = sum(info.file_size for info in file_infos)
 
-            with console.status(f"Extracting {len(file_list)} files..."):
-                zf.extractall(outdir)
+            with console.status(f"Extracting {len(file_infos)} files..."):
+                _extract_members(zf, outdir, infos)
 
             console.print(
-                f"[green]✓ Successfully extracted {len(file_list)} files to {outdir}[/green]"
+                f"[green]✓ Successfully extracted {len(file_infos)} files to {outdir}[/green]"
             )
 
             # Show summary
-            total_size = sum(
-                info.file_size for info in zf.infolist() if not info.is_dir()
-            )
             console.print(f"[dim]Total size: {total_size:,} bytes[/dim]")
 
     except (OSError, zipfile.BadZipFile) as e:
@@ -1,63 +1,156 @@
 """Global commands for AtPack CLI."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Dict, Iterator, List, Optional, Tuple
 
 import typer
 from rich.panel import Panel
 from rich.table import Table
 
-from .. import AtPackParser
 from ..utils import get_family_emoji
-from .common import console
+from .common import OutputFormat, console, load_atpack_summary, stream_json
+
+# Sub-apps of the command tree
+_SUB_APPS = {
+    "files": ("📁", "AtPack file management"),
+    "devices": ("🔌", "Device information"),
+    "memory": ("💾", "Memory information"),
+    "registers": ("📋", "Register information"),
+    "config": ("⚙️", "Configuration information"),
+}
+
+# Commands for each sub-app
+_SUB_COMMANDS = {
+    "files": [
+        ("list", "List files in an AtPack"),
+        ("info", "Show AtPack file information"),
+        ("extract", "Extract AtPack file"),
+    ],
+    "devices": [
+        ("list", "List all devices"),
+        ("info", "Show device details"),
+        ("search", "Search devices by pattern"),
+        ("packages", "List device packages/variants"),
+        ("pinout", "Show device pinout information"),
+    ],
+    "memory": [("show", "Show memory layout")],
+    "registers": [("list", "List registers"), ("show", "Show register details")],
+    "config": [("show", "Show configuration information")],
+}
+
+# Global commands
+_GLOBAL_COMMANDS = (
+    ("scan", "🔍", "Scan directory for AtPack files"),
+    ("help-tree", "🌳", "Show command tree structure"),
+    ("tui", "🖥️", "Launch Terminal User Interface"),
+)
+
+# Detailed help for each command
+_HELP_MAP = {
+    "files": "📁 Files: list, info, extract - Manage AtPack files\n  Example: atpack files list mypack.atpack",
+    "devices": "🔌 Devices: list, info, search, packages, pinout - Device information\n  Example: atpack devices search '*877*' mypack.atpack",
+    "memory": "💾 Memory: show - Memory layouts\n  Example: atpack memory show ATmega16 mypack.atpack",
+    "registers": "📋 Registers: list, show - Register details\n  Example: atpack registers list ATmega16 mypack.atpack",
+    "config": "⚙️ Config: show - Configuration data\n  Example: atpack config show ATmega16 mypack.atpack",
+    "scan": "🔍 Scan: Search for AtPack files\n  Example: atpack scan ./atpacks/",
+    "help-tree": "🌳 Help Tree: Show command structure\n  Example: atpack help-tree",
+    "tui": "🖥️ TUI: Launch Terminal User Interface\n  Example: atpack tui",
+}
+
+# Usage examples appended to the command tree
+_EXAMPLES_TEXT = """
+
+📚 Usage Examples:
+  atpack files list mypack.atpack
+  atpack files info mypack.atpack
+  atpack files extract mypack.atpack
+  
+  atpack devices list mypack.atpack
+  atpack devices info PIC16F877 mypack.atpack
+  atpack devices search '*877*' mypack.atpack
+  atpack devices packages ATmega16 mypack.atpack
+  atpack devices pinout PIC16F877 mypack.atpack
+  
+  atpack memory show PIC16F877 mypack.atpack
+  
+  atpack registers list PIC16F877 mypack.atpack
+  atpack registers list PIC16F877 mypack.atpack --module GPIO
+  atpack registers show PIC16F877 PORTB mypack.atpack
+  
+  atpack config show PIC16F877 mypack.atpack
+  atpack config show PIC16F877 mypack.atpack --type fuses
+  
+  atpack scan ./atpacks/ --format json
+    """
+
+
+def _probe_atpack(atpack_path: Path) -> Optional[Tuple[str, str, str, int]]:
+    """Read name, vendor, family and device count of an AtPack, None on failure."""
+    try:
+        metadata, device_family, devices = load_atpack_summary(atpack_path)
+        return metadata.name, metadata.vendor, device_family.value, len(devices)
+    except Exception:
+        return None
+
+
+def _probe_atpacks(
+    atpack_files: List[Path],
+) -> Iterator[Optional[Tuple[str, str, str, int]]]:
+    """Probe AtPacks concurrently, yielding results in the order of atpack_files."""
+    with ThreadPoolExecutor(max_workers=min(32, len(atpack_files) or 1)) as executor:
+        yield from executor.map(_probe_atpack, atpack_files)
+
+
+def _scan_record(
+    atpack_path: Path, probe: Optional[Tuple[str, str, str, int]]
+) -> Dict[str, Any]:
+    """JSON record of a scanned AtPack, with placeholders if it could not be read."""
+    if probe is None:
+        return {
+            "path": str(atpack_path),
+            "name": atpack_path.name,
+            "vendor": "Unknown",
+            "family": "Unknown",
+            "device_count": 0,
+        }
+    name, vendor, family, device_count = probe
+    return {
+        "path": str(atpack_path),
+        "name": name,
+        "vendor": vendor,
+        "family": family,
+        "device_count": device_count,
+    }
 
 
 def scan(
     directory: Annotated[
         Path, typer.Argument(help="Directory to scan for AtPack files")
     ],
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
 ):
     """🔍 Scan directory for AtPack files."""
     try:
         atpack_files = []
 
-        # Look for .atpack files and directories with _atpack suffix
+        # Look for .atpack files and directories with _atpack suffix in one
+        # walk, only entries whose name matches are stat'ed
         for path in directory.rglob("*"):
-            if path.is_file() and path.suffix == ".atpack":
-                atpack_files.append(path)
-            elif path.is_dir() and path.name.endswith("_atpack"):
+            if path.suffix == ".atpack":
+                if path.is_file():
+                    atpack_files.append(path)
+            elif path.name.endswith("_atpack") and path.is_dir():
                 atpack_files.append(path)
 
         if format == "json":
-            data = []
-            for atpack_path in atpack_files:
-                try:
-                    parser = AtPackParser(atpack_path)
-                    metadata = parser.metadata
-                    data.append(
-                        {
-                            "path": str(atpack_path),
-                            "name": metadata.name,
-                            "vendor": metadata.vendor,
-                            "family": parser.device_family.value,
-                            "device_count": len(parser.get_devices()),
-                        }
-                    )
-                except Exception:
-                    data.append(
-                        {
-                            "path": str(atpack_path),
-                            "name": atpack_path.name,
-                            "vendor": "Unknown",
-                            "family": "Unknown",
-                            "device_count": 0,
-                        }
-                    )
-            print(json.dumps(data, indent=2))
+            # Stream one record per AtPack as soon as it has been probed
+            stream_json(
+                _scan_record(atpack_path, probe)
+                for atpack_path, probe in zip(
+                    atpack_files, _probe_atpacks(atpack_files)
+                )
+            )
         else:
             table = Table(title=f"🔍 AtPack Files in {directory}")
             table.add_column("Path", style="cyan")
@@ -66,12 +159,10 @@ def scan(
             table.add_column("Family", style="blue")
             table.add_column("Devices", style="magenta")
 
-            for atpack_path in sorted(atpack_files):
-                try:
-                    parser = AtPackParser(atpack_path)
-                    metadata = parser.metadata
-                    device_count = len(parser.get_devices())
-                    family = parser.device_family.value
+            sorted_files = sorted(atpack_files)
+            for atpack_path, probe in zip(sorted_files, _probe_atpacks(sorted_files)):
+                if probe is not None:
+                    name, vendor, family, device_count = probe
 
                     # Family emoji
                     family_emoji = get_family_emoji(family)
@@ -80,12 +171,12 @@ def scan(
 
                     table.add_row(
                         str(atpack_path.relative_to(directory)),
-                        metadata.name,
-                        metadata.vendor,
+                        name,
+                        vendor,
                         family_display,
                         str(device_count),
                     )
-                except Exception:
+                else:
                     table.add_row(
                         str(atpack_path.relative_to(directory)),
                         atpack_path.name,
@@ -109,33 +200,7 @@ def help_tree_command():
 
 def show_command_tree_content():
     """Show the complete command tree structure."""
-    tree_text = generate_command_tree()
-
-    examples_text = """
-
-📚 Usage Examples:
-  atpack files list mypack.atpack
-  atpack files info mypack.atpack
-  atpack files extract mypack.atpack
-  
-  atpack devices list mypack.atpack
-  atpack devices info PIC16F877 mypack.atpack
-  atpack devices search '*877*' mypack.atpack
-  atpack devices packages ATmega16 mypack.atpack
-  atpack devices pinout PIC16F877 mypack.atpack
-  
-  atpack memory show PIC16F877 mypack.atpack
-  
-  atpack registers list PIC16F877 mypack.atpack
-  atpack registers list PIC16F877 mypack.atpack --module GPIO
-  atpack registers show PIC16F877 PORTB mypack.atpack
-  
-  atpack config show PIC16F877 mypack.atpack
-  atpack config show PIC16F877 mypack.atpack --type fuses
-  
-  atpack scan ./atpacks/ --format json
-    """
-    tree_text += examples_text
+    tree_text = generate_command_tree() + _EXAMPLES_TEXT
 
     panel = Panel(
         tree_text,
@@ -150,51 +215,16 @@ def generate_command_tree() -> str:
     """Generate a dynamic command tree from the Typer app structure."""
     lines = ["🔧 atpack - AtPack Parser CLI"]
 
-    # Get all registered sub-apps
-    sub_apps = {
-        "files": ("📁", "AtPack file management"),
-        "devices": ("🔌", "Device information"),
-        "memory": ("💾", "Memory information"),
-        "registers": ("📋", "Register information"),
-        "config": ("⚙️", "Configuration information"),
-    }
-
-    # Commands for each sub-app
-    sub_commands = {
-        "files": [
-            ("list", "List files in an AtPack"),
-            ("info", "Show AtPack file information"),
-            ("extract", "Extract AtPack file"),
-        ],
-        "devices": [
-            ("list", "List all devices"),
-            ("info", "Show device details"),
-            ("search", "Search devices by pattern"),
-            ("packages", "List device packages/variants"),
-            ("pinout", "Show device pinout information"),
-        ],
-        "memory": [("show", "Show memory layout")],
-        "registers": [("list", "List registers"), ("show", "Show register details")],
-        "config": [("show", "Show configuration information")],
-    }
-
-    # Global commands
-    global_commands = [
-        ("scan", "🔍", "Scan directory for AtPack files"),
-        ("help-tree", "🌳", "Show command tree structure"),
-        ("tui", "🖥️", "Launch Terminal User Interface"),
-    ]
-
     # Build tree for sub-apps
-    sub_app_count = len(sub_apps)
-    for i, (name, (emoji, desc)) in enumerate(sub_apps.items()):
-        is_last_sub_app = i == sub_app_count - 1 and not global_commands
+    sub_app_count = len(_SUB_APPS)
+    for i, (name, (emoji, desc)) in enumerate(_SUB_APPS.items()):
+        is_last_sub_app = i == sub_app_count - 1 and not _GLOBAL_COMMANDS
         prefix = "└── " if is_last_sub_app else "├── "
         lines.append(f"{prefix}{emoji} {name} - {desc}")
 
-        if name in sub_commands:
-            cmd_count = len(sub_commands[name])
-            for j, (cmd_name, cmd_desc) in enumerate(sub_commands[name]):
+        if name in _SUB_COMMANDS:
+            cmd_count = len(_SUB_COMMANDS[name])
+            for j, (cmd_name, cmd_desc) in enumerate(_SUB_COMMANDS[name]):
                 is_last_cmd = j == cmd_count - 1
                 if is_last_sub_app:
                     sub_prefix = "    └── " if is_last_cmd else "    ├── "
@@ -203,8 +233,8 @@ def generate_command_tree() -> str:
                 lines.append(f"{sub_prefix}{cmd_name} - {cmd_desc}")
 
     # Add global commands
-    for i, (cmd_name, emoji, desc) in enumerate(global_commands):
-        is_last = i == len(global_commands) - 1
+    for i, (cmd_name, emoji, desc) in enumerate(_GLOBAL_COMMANDS):
+        is_last = i == len(_GLOBAL_COMMANDS) - 1
         prefix = "└── " if is_last else "├── "
         lines.append(f"{prefix}{emoji} {cmd_name} - {desc}")
 
@@ -256,20 +286,11 @@ def interactive_help(
 
     else:
         # Show specific command help
-        help_map = {
-            "files": "📁 Files: list, info, extract - Manage AtPack files\n  Example: atpack files list mypack.atpack",
-            "devices": "🔌 Devices: list, info, search, packages, pinout - Device information\n  Example: atpack devices search '*877*' mypack.atpack",
-            "memory": "💾 Memory: show - Memory layouts\n  Example: atpack memory show ATmega16 mypack.atpack",
-            "registers": "📋 Registers: list, show - Register details\n  Example: atpack registers list ATmega16 mypack.atpack",
-            "config": "⚙️ Config: show - Configuration data\n  Example: atpack config show ATmega16 mypack.atpack",
-            "scan": "🔍 Scan: Search for AtPack files\n  Example: atpack scan ./atpacks/",
-            "help-tree": "🌳 Help Tree: Show command structure\n  Example: atpack help-tree",
-            "tui": "🖥️ TUI: Launch Terminal User Interface\n  Example: atpack tui",
-        }
-
-        if command in help_map:
+        if command in _HELP_MAP:
             panel = Panel(
-                help_map[command], title=f"❓ Help for '{command}'", border_style="blue"
+                _HELP_MAP[command],
+                title=f"❓ Help for '{command}'",
+                border_style="blue",
             )
             console.print(panel)
         else:
@@ -1,32 +1,87 @@
 """Interactive CLI mode using Rich and Prompt Toolkit."""
 
 import os
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import InMemoryHistory
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 from .. import AtPackParser
 from ..exceptions import AtPackError
-from ..display import display_hierarchical_memory, display_registers
+from ..display import display_hierarchical_memory, display_registers, get_console
 
-console = Console()
+console = get_console()
+
+# Pagination choices with their labels, shown when available on a page
+_PAGE_ACTIONS = (("p", "(p)revious"), ("n", "(n)ext"), ("q", "(q)uit"))
+
+
+class _AtPackFile(NamedTuple):
+    """AtPack file found by a directory scan."""
+
+    name: str
+    size: int
+    path: str
+
+
+# Session commands as (usage, description, example) shown by 'help'
+_COMMANDS_HELP = (
+    ("help", "Show this help", "help"),
+    ("scan [dir]", "Scan directory for AtPack files", "scan ./atpacks"),
+    ("load <file>", "Load an AtPack file", "load mypack.atpack"),
+    ("info", "Show AtPack information", "info"),
+    ("devices", "List all devices", "devices"),
+    ("select <device>", "Select a device", "select ATmega328P"),
+    ("device-info", "Show selected device information", "device-info"),
+    ("memory", "Show device memory layout", "memory"),
+    ("registers", "Show device registers", "registers"),
+    ("files", "Show files in AtPack", "files"),
+    ("config", "Show AtPack configuration", "config"),
+    ("status", "Show session status", "status"),
+    ("clear", "Clear screen", "clear"),
+    ("exit/quit", "Exit session", "exit"),
+)
+
+
+def _build_help_table() -> Table:
+    """Build the table of session commands shown by 'help'."""
+    table = Table(
+        title="Available Commands", show_header=True, header_style="bold magenta"
+    )
+    table.add_column("Command", style="cyan", no_wrap=True)
+    table.add_column("Description", style="white")
+    table.add_column("Example", style="dim")
+
+    for cmd, desc, example in _COMMANDS_HELP:
+        table.add_row(cmd, desc, example)
+
+    return table
 
 
 class InteractiveSession:
     """Interactive CLI session manager."""
 
+    # Help table shared by all sessions, built by the first 'help'
+    _help_table: Optional[Table] = None
+
     def __init__(self):
+        # prompt_toolkit is only imported once a session is actually created,
+        # so other CLI commands do not pay for it at startup
+        from prompt_toolkit.history import InMemoryHistory
+
         self.parser: Optional[AtPackParser] = None
         self.current_atpack: Optional[Path] = None
+        self._current_stem = ""
+        self._family_str = ""
         self.current_device: Optional[str] = None
+        # Device names of the loaded AtPack, with lowercase copies for searches
+        self._devices: List[str] = []
+        self._devices_lower: List[str] = []
+        # Scanned AtPack files per directory, with the directory mtime
+        self._scan_cache: Dict[str, Tuple[int, List[_AtPackFile]]] = {}
         self.history = InMemoryHistory()
         self.session_commands = {
             "help": self.show_help,
@@ -48,6 +103,10 @@ class InteractiveSession:
 
     def start(self) -> None:
         """Start the interactive session."""
+        from prompt_toolkit import prompt
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.formatted_text import HTML
+
         console.print(
             Panel.fit(
                 "[bold blue]🔧 AtPack Parser - Interactive Mode[/bold blue]\n"
@@ -63,17 +122,24 @@ class InteractiveSession:
         # Auto-scan for AtPack files
         self.scan_directory(silent=True)
 
+        # Create command completer
+        completer = WordCompleter(list(self.session_commands.keys()))
+
+        # Prompt message, rebuilt only when the loaded AtPack or device changes
+        prompt_state = None
+        prompt_message = None
+
         while True:
             try:
-                # Create command completer
-                completer = WordCompleter(list(self.session_commands.keys()))
-
                 # Show current context in prompt
-                context = self._get_context_prompt()
+                if prompt_state != (self.current_atpack, self.current_device):
+                    prompt_state = (self.current_atpack, self.current_device)
+                    context = self._get_context_prompt()
+                    prompt_message = HTML(f"<ansiblue>{context}</ansiblue> ❯ ")
 
                 # Get user input with completion
                 user_input = prompt(
-                    HTML(f"<ansiblue>{context}</ansiblue> ❯ "),
+                    prompt_message,
                     completer=completer,
                     history=self.history,
                 ).strip()
@@ -104,46 +170,20 @@ class InteractiveSession:
 
     def _get_context_prompt(self) -> str:
         """Get context information for the prompt."""
-        parts = ["atpack"]
-
-        if self.current_atpack:
-            parts.append(f"[{self.current_atpack.stem}]")
-
-        if self.current_device:
-            parts.append(f"({self.current_device})")
-
-        return "".join(parts)
+        # A device can only be selected once an AtPack is loaded
+        if not self.current_atpack:
+            return "atpack"
+        if not self.current_device:
+            return f"atpack[{self._current_stem}]"
+        return f"atpack[{self._current_stem}]({self.current_device})"
 
     def show_help(self, args: List[str]) -> None:
         """Show help information."""
-        table = Table(
-            title="Available Commands", show_header=True, header_style="bold magenta"
-        )
-        table.add_column("Command", style="cyan", no_wrap=True)
-        table.add_column("Description", style="white")
-        table.add_column("Example", style="dim")
-
-        commands_help = [
-            ("help", "Show this help", "help"),
-            ("scan [dir]", "Scan directory for AtPack files", "scan ./atpacks"),
-            ("load <file>", "Load an AtPack file", "load mypack.atpack"),
-            ("info", "Show AtPack information", "info"),
-            ("devices", "List all devices", "devices"),
-            ("select <device>", "Select a device", "select ATmega328P"),
-            ("device-info", "Show selected device information", "device-info"),
-            ("memory", "Show device memory layout", "memory"),
-            ("registers", "Show device registers", "registers"),
-            ("files", "Show files in AtPack", "files"),
-            ("config", "Show AtPack configuration", "config"),
-            ("status", "Show session status", "status"),
-            ("clear", "Clear screen", "clear"),
-            ("exit/quit", "Exit session", "exit"),
-        ]
+        # The table never changes, so it is built on first use and reused
+        if InteractiveSession._help_table is None:
+            InteractiveSession._help_table = _build_help_table()
 
-        for cmd, desc, example in commands_help:
-            table.add_row(cmd, desc, example)
-
-        console.print(table)
+        console.print(InteractiveSession._help_table)
 
     def exit_session(self, args: List[str]) -> None:
         """Exit the interactive session."""
@@ -151,7 +191,7 @@ class InteractiveSession:
 
     def clear_screen(self, args: List[str]) -> None:
         """Clear the screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        console.clear()
 
     def scan_directory(self, args: List[str] = None, silent: bool = False) -> None:
         """Scan directory for AtPack files."""
@@ -166,7 +206,7 @@ class InteractiveSession:
                 console.print(f"[red]Directory not found: {directory}[/red]")
                 return
 
-            atpack_files = list(scan_path.glob("*.atpack"))
+            atpack_files = self._find_atpack_files(scan_path)
 
             if not atpack_files:
                 console.print(f"[red]No AtPack files found in {directory}[/red]")
@@ -179,7 +219,7 @@ class InteractiveSession:
                 table.add_column("Size", style="green")
 
                 for i, file in enumerate(atpack_files, 1):
-                    size = f"{file.stat().st_size / 1024 / 1024:.1f} MB"
+                    size = f"{file.size / 1024 / 1024:.1f} MB"
                     table.add_row(str(i), file.name, size)
 
                 console.print(table)
@@ -189,19 +229,40 @@ class InteractiveSession:
                     if Confirm.ask(
                         f"[yellow]Auto-load {atpack_files[0].name}?[/yellow]"
                     ):
-                        self.load_atpack([str(atpack_files[0])])
+                        self.load_atpack([atpack_files[0].path])
                 console.print("\nUse 'load' to load an AtPack file.")
 
         except Exception as e:
             console.print(f"[red]Error during scan: {e}[/red]")
 
+    def _find_atpack_files(self, directory: Path) -> List[_AtPackFile]:
+        """Find AtPack files in a directory, cached until the directory changes."""
+        key = str(directory)
+        mtime = directory.stat().st_mtime_ns
+        cached = self._scan_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # A single scandir pass, entries carry their own cached stat results
+        with os.scandir(directory) as entries:
+            atpack_files = [
+                _AtPackFile(entry.name, entry.stat().st_size, entry.path)
+                for entry in entries
+                if entry.name.endswith(".atpack")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+
+        self._scan_cache[key] = (mtime, atpack_files)
+        return atpack_files
+
     def load_atpack(self, args: List[str]) -> None:
         """Load an AtPack file."""
         if not args:
             # Interactive file selection
             directory = Path("./atpacks")
             if directory.exists():
-                atpack_files = list(directory.glob("*.atpack"))
+                atpack_files = self._find_atpack_files(directory)
                 if atpack_files:
                     console.print("[yellow]Available AtPack files:[/yellow]")
                     for i, file in enumerate(atpack_files, 1):
@@ -224,7 +285,7 @@ class InteractiveSession:
                             console.print("[red]File not found[/red]")
                             return
 
-                    args = [str(selected_file)]
+                    args = [selected_file.path]
                 else:
                     console.print("[red]No AtPack files found[/red]")
                     return
@@ -240,14 +301,21 @@ class InteractiveSession:
 
         try:
             with console.status(f"[yellow]Loading {file_path.name}...[/yellow]"):
-                self.parser = AtPackParser(file_path)
+                parser = AtPackParser(file_path)
+                devices = list(parser.get_devices())
+                family_str = parser.device_family.value
+
+                self.parser = parser
                 self.current_atpack = file_path
+                self._current_stem = file_path.stem
+                self._family_str = family_str
                 self.current_device = None
+                self._devices = devices
+                self._devices_lower = [d.lower() for d in devices]
 
-            devices = self.parser.get_devices()
             console.print("[green]✅ AtPack loaded successfully![/green]")
-            console.print(f"Family: {self.parser.device_family.value}")
-            console.print(f"Devices: {len(devices)}")
+            console.print(f"Family: {self._family_str}")
+            console.print(f"Devices: {len(self._devices)}")
             console.print(
                 "\nUse 'devices' to see list of devices in this AtPack file and/or 'select' a given device."
             )
@@ -265,14 +333,14 @@ class InteractiveSession:
 
         try:
             metadata = self.parser.metadata
-            devices = list(self.parser.get_devices())
+            devices = self._devices
 
             # Calculate file size
             file_size = self.current_atpack.stat().st_size / 1024 / 1024
 
             panel_content = f"""[bold]AtPack File:[/bold] {self.current_atpack.name}
 [bold]File Size:[/bold] {file_size:.1f} MB
-[bold]Device Family:[/bold] {self.parser.device_family.value}
+[bold]Device Family:[/bold] {self._family_str}
 [bold]Total Devices:[/bold] {len(devices)}
 [bold]Vendor:[/bold] {getattr(metadata, "vendor", "Unknown")}
 [bold]Pack Version:[/bold] {getattr(metadata, "version", "Unknown")}
@@ -308,12 +376,16 @@ class InteractiveSession:
             console.print("[red]No AtPack loaded. Use 'load <file>'[/red]")
             return
 
-        devices = list(self.parser.get_devices())
+        devices = self._devices
 
         # Filter devices if search term provided
         if args:
             search_term = args[0].lower()
-            devices = [d for d in devices if search_term in d.lower()]
+            devices = [
+                d
+                for d, d_lower in zip(self._devices, self._devices_lower)
+                if search_term in d_lower
+            ]
             console.print(f"[yellow]Devices containing '{search_term}':[/yellow]")
 
         if not devices:
@@ -333,14 +405,15 @@ class InteractiveSession:
         while True:
             start_idx = current_page * page_size
             end_idx = min(start_idx + page_size, len(devices))
-            page_devices = devices[start_idx:end_idx]
 
             table = Table(title=f"Devices (Page {current_page + 1}/{total_pages})")
             table.add_column("No.", style="cyan")
             table.add_column("Device", style="white")
             table.add_column("Status", style="green")
 
-            for i, device in enumerate(page_devices, start_idx + 1):
+            for i, device in enumerate(
+                islice(devices, start_idx, end_idx), start_idx + 1
+            ):
                 status = "🎯 SELECTED" if device == self.current_device else ""
                 table.add_row(str(i), str(device), status)
 
@@ -349,30 +422,26 @@ class InteractiveSession:
             if total_pages <= 1:
                 break
 
-            # Navigation options
-            actions = []
-            if current_page > 0:
-                actions.append("(p)revious")
-            if current_page < total_pages - 1:
-                actions.append("(n)ext")
-            actions.append("(q)uit")
-
-            if len(actions) > 1:
-                choices = []
-                if current_page > 0:
-                    choices.append("p")
-                if current_page < total_pages - 1:
-                    choices.append("n")
-                choices.append("q")
-
-                action = Prompt.ask(f"Actions: {', '.join(actions)}", choices=choices)
-
-                if action == "p" and current_page > 0:
-                    current_page -= 1
-                elif action == "n" and current_page < total_pages - 1:
-                    current_page += 1
-                else:
-                    break
+            # Navigation options available on this page
+            has_previous = current_page > 0
+            has_next = current_page < total_pages - 1
+            navigation = [
+                action
+                for action, available in zip(
+                    _PAGE_ACTIONS, (has_previous, has_next, True)
+                )
+                if available
+            ]
+
+            action = Prompt.ask(
+                f"Actions: {', '.join(label for _, label in navigation)}",
+                choices=[choice for choice, _ in navigation],
+            )
+
+            if action == "p" and has_previous:
+                current_page -= 1
+            elif action == "n" and has_next:
+                current_page += 1
             else:
                 break
 
@@ -391,7 +460,7 @@ class InteractiveSession:
 
         if not args:
             # Interactive device selection
-            devices = list(self.parser.get_devices())
+            devices = self._devices
             console.print(
                 f"[yellow]Select a device from {len(devices)} available:[/yellow]"
             )
@@ -408,16 +477,19 @@ class InteractiveSession:
         else:
             device_name = args[0]
 
-        devices = list(self.parser.get_devices())
-
         # Exact match first
-        if device_name in devices:
+        if device_name in self._devices:
             self.current_device = device_name
             print_device_selected(device_name)
             return
 
         # Partial match
-        matches = [d for d in devices if device_name.lower() in d.lower()]
+        search_term = device_name.lower()
+        matches = [
+            d
+            for d, d_lower in zip(self._devices, self._devices_lower)
+            if search_term in d_lower
+        ]
 
         if not matches:
             console.print(f"[red]No device found for: {device_name}[/red]")
@@ -450,7 +522,7 @@ class InteractiveSession:
             device = self.parser.get_device(self.current_device)
 
             panel_content = f"""[bold]Device:[/bold] {self.current_device}
-[bold]Family:[/bold] {self.parser.device_family.value}
+[bold]Family:[/bold] {self._family_str}
 [bold]Architecture:[/bold] {getattr(device, "architecture", "Not specified")}
 [bold]Package:[/bold] {getattr(device, "package", "Not specified")}
 [bold]Flash Size:[/bold] {getattr(device, "flash_size", "Not specified")}
@@ -516,16 +588,24 @@ class InteractiveSession:
 
             if extracted_dir.exists():
                 file_types = [
-                    ("ATDF", "**/*.atdf"),
-                    ("PIC", "**/*.pic"),
-                    ("Headers", "**/*.h"),
-                    ("Linker Scripts", "**/*.ld"),
-                    ("XML", "**/*.xml"),
+                    ("ATDF", ".atdf"),
+                    ("PIC", ".pic"),
+                    ("Headers", ".h"),
+                    ("Linker Scripts", ".ld"),
+                    ("XML", ".xml"),
                 ]
 
-                for file_type, pattern in file_types:
-                    files = list(extracted_dir.glob(pattern))
-                    examples = files[0].name if files else "None"
+                # Bucket files by extension in a single walk of the tree
+                files_by_ext: Dict[str, List[str]] = {ext: [] for _, ext in file_types}
+                for _, _, filenames in os.walk(extracted_dir):
+                    for filename in filenames:
+                        bucket = files_by_ext.get(os.path.splitext(filename)[1])
+                        if bucket is not None:
+                            bucket.append(filename)
+
+                for file_type, ext in file_types:
+                    files = files_by_ext[ext]
+                    examples = files[0] if files else "None"
                     table.add_row(file_type, str(len(files)), examples)
 
             else:
@@ -544,8 +624,8 @@ class InteractiveSession:
             return
 
         panel_content = f"""[bold]AtPack File:[/bold] {self.current_atpack.name}
-[bold]Device Family:[/bold] {self.parser.device_family.value}
-[bold]Device Count:[/bold] {len(self.parser.get_devices())}
+[bold]Device Family:[/bold] {self._family_str}
+[bold]Device Count:[/bold] {len(self._devices)}
 [bold]Selected Device:[/bold] {self.current_device or "None"}"""
 
         console.print(
@@ -560,11 +640,9 @@ class InteractiveSession:
             status_items.append(
                 f"[green]✅ AtPack loaded:[/green] {self.current_atpack.name}"
             )
+            status_items.append(f"[green]✅ Family:[/green] {self._family_str}")
             status_items.append(
-                f"[green]✅ Family:[/green] {self.parser.device_family.value}"
-            )
-            status_items.append(
-                f"[green]✅ Available devices:[/green] {len(self.parser.get_devices())}"
+                f"[green]✅ Available devices:[/green] {len(self._devices)}"
             )
         else:
             status_items.append("[red]❌ No AtPack loaded[/red]")
@@ -1,20 +1,23 @@
 """Memory command group for AtPack CLI."""
 
-import json
-from pathlib import Path
+from itertools import chain
 from typing import Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from .. import AtPackParser
 from ..exceptions import AtPackError, DeviceNotFoundError
 from .common import (
     AtPackPath,
     DeviceName,
+    NoColor,
+    OutputFile,
+    OutputFormat,
     console,
+    get_output_console,
+    get_parser,
     handle_atpack_error,
     handle_device_not_found_error,
+    stream_models_json,
 )
 from ..display import display_flat_memory, display_hierarchical_memory
 
@@ -26,9 +29,7 @@ memory_app = typer.Typer(name="memory", help="💾 Memory information")
 def show_memory(
     device_name: DeviceName,
     atpack_path: AtPackPath,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
     flat: Annotated[
         bool,
         typer.Option(
@@ -39,30 +40,35 @@ def show_memory(
         Optional[str],
         typer.Option("--segment", "-s", help="Show specific memory segment"),
     ] = None,
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
+    output: OutputFile = None,
+    no_color: NoColor = False,
+    pretty: Annotated[
+        bool,
+        typer.Option(
+            "--pretty",
+            help="Indent JSON exported to a file (stdout is always indented)",
+        ),
     ] = False,
 ):
     """💾 Show memory layout for a device."""
     try:
-        parser = AtPackParser(atpack_path)
+        parser = get_parser(atpack_path)
 
         # Default is hierarchical, flat is the option
         hierarchical = not flat
+        segment_upper = segment.upper() if segment else None
 
         if hierarchical:
             memory_spaces = parser.get_device_memory_hierarchical(device_name)
 
-            # Flatten for filtering if segment is specified
+            # Flatten and filter in one pass if segment is specified
             if segment:
-                all_segments = []
-                for space in memory_spaces:
-                    all_segments.extend(space.segments)
                 memory_segments = [
-                    seg for seg in all_segments if seg.name.upper() == segment.upper()
+                    seg
+                    for seg in chain.from_iterable(
+                        space.segments for space in memory_spaces
+                    )
+                    if seg.name.upper() == segment_upper
                 ]
                 if not memory_segments:
                     console.print(
@@ -79,9 +85,7 @@ def show_memory(
             # Filter by segment if specified
             if segment:
                 memory_segments = [
-                    seg
-                    for seg in memory_segments
-                    if seg.name.upper() == segment.upper()
+                    seg for seg in memory_segments if seg.name.upper() == segment_upper
                 ]
                 if not memory_segments:
                     console.print(
@@ -92,16 +96,15 @@ def show_memory(
                     raise typer.Exit(1)
 
         if format == "json":
+            # Files are compact unless asked otherwise, stdout stays readable
+            pretty = pretty or not output
             if hierarchical and memory_segments is None:
                 # Export hierarchical structure
-                data = [space.model_dump() for space in memory_spaces]
+                stream_models_json(memory_spaces, output, pretty)
             else:
                 # Export flat segments
-                data = [seg.model_dump() for seg in memory_segments]
-
-            json_output = json.dumps(data, indent=2)
+                stream_models_json(memory_segments, output, pretty)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 count_items = len(
                     memory_spaces
                     if hierarchical and memory_segments is None
@@ -115,15 +118,10 @@ def show_memory(
                 console.print(
                     f"[green]Exported {count_items} {item_type} to {output}[/green]"
                 )
-            else:
-                print(json_output)
         else:
             # Create console with color control
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            # Recorded so a file export reuses the single terminal render
+            output_console = get_output_console(no_color, record=bool(output))
 
             title = f"💾 Memory Layout: {device_name}"
             if segment:
@@ -139,7 +137,7 @@ def show_memory(
                     memory_spaces, device_name, output_console, no_color
                 )
                 if output:
-                    # Export table as text - will be handled separately
+                    output_console.save_text(str(output))
                     total_segments = sum(len(space.segments) for space in memory_spaces)
                     console.print(
                         f"[green]Exported {len(memory_spaces)} memory spaces "
@@ -151,7 +149,7 @@ def show_memory(
                     memory_segments, device_name, output_console, no_color
                 )
                 if output:
-                    # Export table as text - will be handled separately
+                    output_console.save_text(str(output))
                     console.print(
                         f"[green]Exported {len(memory_segments)} memory "
                         f"segments to {output}[/green]"
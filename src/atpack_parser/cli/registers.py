@@ -1,21 +1,26 @@
 """Registers command group for AtPack CLI."""
 
-import json
-from pathlib import Path
-from typing import Annotated, Optional
+from itertools import groupby
+from typing import Annotated, List, Optional, Tuple
 
 import typer
 from rich.panel import Panel
 from rich.table import Table
 
-from .. import AtPackParser
 from ..exceptions import AtPackError, DeviceNotFoundError
+from ..models import Register, RegisterBitfield
 from .common import (
     AtPackPath,
     DeviceName,
+    NoColor,
+    OutputFile,
+    OutputFormat,
     console,
+    get_output_console,
+    get_parser,
     handle_atpack_error,
     handle_device_not_found_error,
+    write_json,
 )
 from ..display import display_registers
 
@@ -23,6 +28,70 @@ from ..display import display_registers
 registers_app = typer.Typer(name="registers", help="📋 Register information")
 
 
+def _bitfield_rows(register: Register) -> List[Tuple[str, str, str, str, str]]:
+    """Rows of the bitfields table, ordered by bit position.
+
+    A multi-bit field is listed at its lowest bit, single-bit fields inside it
+    are shown as indented aliases. Other single-bit fields sharing a bit are
+    listed under a primary field, the shortest name without an underscore.
+    """
+    # Mask formatter specialized once for the register width
+    format_mask = f"0x{{:0{register.size * 2}X}}".format
+
+    def row(name: str, bit_range: str, bf: RegisterBitfield) -> tuple:
+        values_str = f"{len(bf.values)} values" if bf.values else "N/A"
+        return (
+            name,
+            bit_range,
+            format_mask(bf.mask),
+            bf.caption or "N/A",
+            values_str,
+        )
+
+    rows = []
+    covered_to = -1  # Highest bit covered by a multi-bit field so far
+    displayed_multibit_fields = set()
+
+    # One pass over the bitfields grouped by bit position (ascending order)
+    sorted_bitfields = sorted(register.bitfields, key=lambda bf: bf.bit_offset)
+    for bit_pos, fields in groupby(sorted_bitfields, key=lambda bf: bf.bit_offset):
+        single_bit_fields = []
+        for bf in fields:
+            if bf.bit_width > 1:
+                # Multi-bit fields first, only once per field
+                covered_to = max(covered_to, bf.bit_offset + bf.bit_width - 1)
+                if bf.name not in displayed_multibit_fields:
+                    displayed_multibit_fields.add(bf.name)
+                    bit_range = f"{bf.bit_offset + bf.bit_width - 1}:{bf.bit_offset}"
+                    rows.append(row(bf.name, bit_range, bf))
+            elif bf.bit_width == 1:
+                single_bit_fields.append(bf)
+
+        if not single_bit_fields:
+            continue
+
+        if bit_pos <= covered_to:
+            # This bit is part of a multi-bit field - show as indented aliases
+            for bf in single_bit_fields:
+                rows.append(row(f"├─ {bf.name}", f"{bf.bit_offset}", bf))
+        else:
+            # Prefer shorter, simpler names as primary (e.g., "R" over "I2C_READ")
+            primary_field = single_bit_fields[0]
+            for bf in single_bit_fields:
+                if len(bf.name) < len(primary_field.name) and "_" not in bf.name:
+                    primary_field = bf
+
+            bit_range = f"{primary_field.bit_offset}"
+            rows.append(row(primary_field.name, bit_range, primary_field))
+
+            # Show aliases indented
+            for alias in single_bit_fields:
+                if alias != primary_field:
+                    rows.append(row(f"├─ {alias.name}", bit_range, alias))
+
+    return rows
+
+
 @registers_app.command("list")
 def list_registers(
     device_name: DeviceName,
@@ -30,25 +99,27 @@ def list_registers(
     module: Annotated[
         Optional[str], typer.Option("--module", "-m", help="Filter by module")
     ] = None,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
-    output: Annotated[
-        Optional[Path], typer.Option("--output", "-o", help="Export to file")
-    ] = None,
-    no_color: Annotated[
-        bool, typer.Option("--no-color", help="Disable colored output")
+    format: OutputFormat = "table",
+    output: OutputFile = None,
+    no_color: NoColor = False,
+    pretty: Annotated[
+        bool,
+        typer.Option(
+            "--pretty",
+            help="Indent JSON exported to a file (stdout is always indented)",
+        ),
     ] = False,
 ):
     """📋 List registers for a device."""
     try:
-        parser = AtPackParser(atpack_path)
+        parser = get_parser(atpack_path)
         device = parser.get_device(device_name)
 
         # Collect registers
         registers = []
+        module_upper = module.upper() if module else None
         for mod in device.modules:
-            if module and mod.name.upper() != module.upper():
+            if module and mod.name.upper() != module_upper:
                 continue
             for rg in mod.register_groups:
                 for reg in rg.registers:
@@ -64,29 +135,22 @@ def list_registers(
                 reg_data["group"] = item["group"]
                 data.append(reg_data)
 
-            json_output = json.dumps(data, indent=2)
+            # Files are compact unless asked otherwise, stdout stays readable
+            write_json(data, output, pretty=pretty or not output)
             if output:
-                output.write_text(json_output, encoding="utf-8")
                 console.print(
                     f"[green]Exported {len(registers)} registers to {output}[/green]"
                 )
-            else:
-                print(json_output)
         else:
-            from rich.console import Console
-
-            # Create console with color control
-            output_console = (
-                Console(force_terminal=not no_color)
-                if not no_color
-                else Console(force_terminal=False)
-            )
+            # Create console with color control, recorded so a file export
+            # reuses the single terminal render
+            output_console = get_output_console(no_color, record=bool(output))
 
             # Use shared display function
             display_registers(device, device_name, output_console, no_color, module)
 
             if output:
-                # Export would need to be handled separately
+                output_console.save_text(str(output))
                 console.print(
                     f"[green]Exported {len(registers)} registers to {output}[/green]"
                 )
@@ -102,27 +166,15 @@ def show_register(
     register_name: Annotated[str, typer.Argument(help="Register name")],
     device_name: DeviceName,
     atpack_path: AtPackPath,
-    format: Annotated[
-        str, typer.Option("--format", "-f", help="Output format")
-    ] = "table",
+    format: OutputFormat = "table",
 ):
     """📋 Show detailed register information."""
     try:
-        parser = AtPackParser(atpack_path)
+        parser = get_parser(atpack_path)
         device = parser.get_device(device_name)
 
         # Find register
-        found_register = None
-        for mod in device.modules:
-            for rg in mod.register_groups:
-                for reg in rg.registers:
-                    if reg.name.upper() == register_name.upper():
-                        found_register = reg
-                        break
-                if found_register:
-                    break
-            if found_register:
-                break
+        found_register = device.register_index.get(register_name.upper())
 
         if not found_register:
             console.print(
@@ -161,137 +213,15 @@ def show_register(
                 table.add_column("Description", style="white")
                 table.add_column("Values", style="dim")
 
-                # Sort bitfields by bit position (ascending order)
-                sorted_bitfields = sorted(
-                    found_register.bitfields, key=lambda bf: bf.bit_offset
-                )
+                for row in _bitfield_rows(found_register):
+                    table.add_row(*row)
 
-                # Group bitfields by bit position to identify primary fields and aliases
-                bit_groups = {}  # Maps bit_position -> [list of bitfields at that position]
-
-                for bf in sorted_bitfields:
-                    if bf.bit_width > 1:
-                        # Multi-bit field - create entry for each bit it covers
-                        for bit_pos in range(
-                            bf.bit_offset, bf.bit_offset + bf.bit_width
-                        ):
-                            if bit_pos not in bit_groups:
-                                bit_groups[bit_pos] = []
-                            bit_groups[bit_pos].append(bf)
-                    else:
-                        # Single-bit field
-                        if bf.bit_offset not in bit_groups:
-                            bit_groups[bf.bit_offset] = []
-                        bit_groups[bf.bit_offset].append(bf)
-
-                # Process each bit position in order
-                displayed_multibit_fields = (
-                    set()
-                )  # Track multi-bit fields we've already shown
-
-                for bit_pos in sorted(bit_groups.keys()):
-                    fields_at_this_bit = bit_groups[bit_pos]
-
-                    # Separate multi-bit fields from single-bit fields
-                    multi_bit_fields = [
-                        bf for bf in fields_at_this_bit if bf.bit_width > 1
-                    ]
-                    single_bit_fields = [
-                        bf for bf in fields_at_this_bit if bf.bit_width == 1
-                    ]
-
-                    # Show multi-bit fields first (only once per field)
-                    for bf in multi_bit_fields:
-                        if bf.name not in displayed_multibit_fields:
-                            displayed_multibit_fields.add(bf.name)
-
-                            bit_range = (
-                                f"{bf.bit_offset + bf.bit_width - 1}:{bf.bit_offset}"
-                            )
-                            values_str = (
-                                f"{len(bf.values)} values" if bf.values else "N/A"
-                            )
-
-                            table.add_row(
-                                bf.name,
-                                bit_range,
-                                f"0x{bf.mask:0{found_register.size * 2}X}",
-                                bf.caption or "N/A",
-                                values_str,
-                            )
-
-                    # Show single-bit fields
-                    if single_bit_fields:
-                        # Check if this bit is part of a multi-bit field
-                        parent_multibit = None
-                        for bf in multi_bit_fields:
-                            if bf.bit_offset <= bit_pos < bf.bit_offset + bf.bit_width:
-                                parent_multibit = bf.name
-                                break
-
-                        if parent_multibit:
-                            # This bit is part of a multi-bit field - show as indented aliases
-                            for bf in single_bit_fields:
-                                bit_range = f"{bf.bit_offset}"
-                                values_str = (
-                                    f"{len(bf.values)} values" if bf.values else "N/A"
-                                )
-
-                                table.add_row(
-                                    f"├─ {bf.name}",
-                                    bit_range,
-                                    f"0x{bf.mask:0{found_register.size * 2}X}",
-                                    bf.caption or "N/A",
-                                    values_str,
-                                )
-                        else:
-                            # This bit is NOT part of a multi-bit field - show as primary fields
-                            # Find the primary field (first one, or one that's not obviously an alias)
-                            primary_field = single_bit_fields[0]
-                            for bf in single_bit_fields:
-                                # Prefer shorter, simpler names as primary (e.g., "R" over "I2C_READ")
-                                if (
-                                    len(bf.name) < len(primary_field.name)
-                                    and "_" not in bf.name
-                                ):
-                                    primary_field = bf
-
-                            # Show primary field
-                            bit_range = f"{primary_field.bit_offset}"
-                            values_str = (
-                                f"{len(primary_field.values)} values"
-                                if primary_field.values
-                                else "N/A"
-                            )
-
-                            table.add_row(
-                                primary_field.name,
-                                bit_range,
-                                f"0x{primary_field.mask:0{found_register.size * 2}X}",
-                                primary_field.caption or "N/A",
-                                values_str,
-                            )
-
-                            # Show aliases indented
-                            aliases = [
-                                bf for bf in single_bit_fields if bf != primary_field
-                            ]
-                            for alias in aliases:
-                                alias_values_str = (
-                                    f"{len(alias.values)} values"
-                                    if alias.values
-                                    else "N/A"
-                                )
-
-                                table.add_row(
-                                    f"├─ {alias.name}",
-                                    bit_range,
-                                    f"0x{alias.mask:0{found_register.size * 2}X}",
-                                    alias.caption or "N/A",
-                                    alias_values_str,
-                                )
-
-                console.print(table)
+                if console.is_terminal and table.row_count > console.height:
+                    # Let the user scroll through tables taller than the screen
+                    with console.pager(styles=True):
+                        console.print(table)
+                else:
+                    console.print(table)
 
     except DeviceNotFoundError as e:
         handle_device_not_found_error(e, parser)
@@ -15,15 +15,16 @@ def launch_tui(
     ] = None,
 ):
     """🖥️ Launch the Terminal User Interface (TUI)."""
+    # Validate before importing Textual so a bad path fails fast
+    if directory and not directory.exists():
+        typer.echo(f"❌ Directory '{directory}' does not exist.")
+        raise typer.Exit(1)
+
     try:
         from ..tui.main import run_tui
 
         start_dir = str(directory) if directory else None
 
-        if directory and not directory.exists():
-            typer.echo(f"❌ Directory '{directory}' does not exist.")
-            raise typer.Exit(1)
-
         dir_msg = f" from '{directory}'" if directory else " from './atpacks/'"
         typer.echo(f"🖥️ Starting AtPack Parser TUI{dir_msg}...")
         run_tui(start_dir)
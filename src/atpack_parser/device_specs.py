@@ -5,13 +5,32 @@ from AtPack files. The actual implementation has been integrated into PicParser
 for better code organization and to eliminate code duplication.
 """
 
-from typing import List, Optional
-from pathlib import Path
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+from lxml import etree
 
 from .models import DeviceSpecs, GprSector
 from .parser.pic import PicParser
 from .parser.atpack import AtPackParser
 from .models import DeviceFamily
+from .utils import cache
+
+logger = logging.getLogger(__name__)
+
+# Application Support files that are not devices
+SKIP_PREFIXES = ("AC162",)
+
+
+def _pic_entries(atpack_parser: AtPackParser) -> List[Tuple[str, str]]:
+    """List (path, device name) pairs for the PIC files in an AtPack."""
+    return [
+        (pic_file, os.path.basename(pic_file).rsplit(".", 1)[0])
+        for pic_file in atpack_parser.extractor.find_pic_files()
+    ]
 
 
 def extract_device_specs_from_xml(
@@ -32,6 +51,22 @@ def extract_device_specs_from_xml(
     return parser.extract_device_specs(device_name)
 
 
+def extract_device_specs_from_root(
+    root: etree._Element, device_name: Optional[str] = None
+) -> DeviceSpecs:
+    """Extract device specifications from an already parsed PIC XML tree.
+
+    Args:
+        root: Root element of a parsed PIC file
+        device_name: Optional device name to search for
+
+    Returns:
+        DeviceSpecs: Comprehensive device specifications
+    """
+    parser = PicParser(root)
+    return parser.extract_device_specs(device_name)
+
+
 def extract_device_specs_from_atpack(
     atpack_parser: AtPackParser, device_name: str
 ) -> DeviceSpecs:
@@ -56,33 +91,59 @@ def extract_device_specs_from_atpack(
             "Device specifications extraction is currently only supported for PIC devices"
         )
 
-    # Find PIC file for device
-    pic_files = atpack_parser.extractor.find_pic_files()
-
-    pic_file = None
-    for file_path in pic_files:
-        file_name = Path(file_path).stem
-        if file_name.upper() == device_name.upper():
-            pic_file = file_path
-            break
+    # Find PIC file for device in the parser's cached name index
+    pic_file = atpack_parser._pic_file(device_name)
 
     if not pic_file:
         raise ValueError(f"PIC file for device '{device_name}' not found")
 
-    # Read PIC file content
-    pic_content = atpack_parser.extractor.read_file(pic_file)
+    # Parse PIC file, reusing the extractor's cached tree when available
+    root = atpack_parser.extractor.read_xml(pic_file)
+    return extract_device_specs_from_root(root, device_name)
+
 
-    # Extract specifications using PicParser
-    return extract_device_specs_from_xml(pic_content, device_name)
+def _extract_one(
+    pic_xml: Union[str, etree._Element], device_name: str
+) -> Optional[DeviceSpecs]:
+    """Extract specifications for one PIC file, or None if it cannot be parsed.
+
+    Kept at module level so it can be sent to worker processes.
+    """
+    try:
+        return PicParser(pic_xml).extract_device_specs(device_name)
+    except Exception as e:
+        logger.warning("Failed to extract specs for %s: %s", device_name, e)
+        return None
+
+
+def _read_pic_files(
+    read: Callable[[str], Any], pic_entries: List[Tuple[str, str]]
+) -> Iterator[Tuple[Any, str]]:
+    """Yield (content, device name) pairs, skipping files that cannot be read."""
+    for pic_file, device_name in pic_entries:
+        try:
+            content = read(pic_file)
+        except Exception as e:
+            logger.warning("Failed to extract specs for %s: %s", device_name, e)
+            continue
+        yield content, device_name
 
 
 def extract_all_device_specs_from_atpack(
-    atpack_parser: AtPackParser,
+    atpack_parser: AtPackParser, parallel: bool = False, use_cache: bool = False
 ) -> List[DeviceSpecs]:
     """Extract device specifications for all devices in an AtPack.
 
+    The parallel mode reads every PIC file as a string in this process and
+    pickles it to a worker, bypassing the extractor's parsed tree cache. It
+    starts worker processes, so on spawn platforms (Windows, macOS) the
+    calling script must guard its entry point with
+    ``if __name__ == "__main__":``.
+
     Args:
         atpack_parser: AtPackParser instance
+        parallel: Parse the PIC files in worker processes, one per CPU core
+        use_cache: Reuse specs saved on disk for an unchanged AtPack zip file
 
     Returns:
         List[DeviceSpecs]: List of device specifications for all devices
@@ -99,26 +160,50 @@ def extract_all_device_specs_from_atpack(
             "Device specifications extraction is currently only supported for PIC devices"
         )
 
-    all_specs = []
-    pic_files = atpack_parser.extractor.find_pic_files()
+    cache_file = (
+        cache.cache_file(atpack_parser.atpack_path, "specs") if use_cache else None
+    )
+    if cache_file is not None:
+        cached_specs = cache.load(cache_file)
+        if isinstance(cached_specs, list) and all(
+            isinstance(specs, DeviceSpecs) for specs in cached_specs
+        ):
+            return cached_specs
+
+    pic_entries = [
+        (pic_file, device_name)
+        for pic_file, device_name in _pic_entries(atpack_parser)
+        if not device_name.startswith(SKIP_PREFIXES)
+    ]
+    if parallel and len(pic_entries) > 1:
+        # Workers get file contents, the archive handle cannot be shared with them
+        contents, device_names = [], []
+        for content, device_name in _read_pic_files(
+            atpack_parser.extractor.read_file, pic_entries
+        ):
+            contents.append(content)
+            device_names.append(device_name)
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(_extract_one, contents, device_names, chunksize=16)
+            )
+    else:
+        results = [
+            _extract_one(root, device_name)
+            for root, device_name in _read_pic_files(
+                atpack_parser.extractor.read_xml, pic_entries
+            )
+        ]
+
+    all_specs = [specs for specs in results if specs is not None]
 
-    for pic_file in pic_files:
-        device_name = Path(pic_file).stem
+    # Sort by device name
+    all_specs.sort(key=attrgetter("device_name"))
 
-        # Skip Application Support files that start with AC162
-        if device_name.startswith("AC162"):
-            continue
+    # Only cache complete results, a failed file must be retried next time
+    if cache_file is not None and len(all_specs) == len(pic_entries):
+        cache.store(cache_file, all_specs)
 
-        try:
-            pic_content = atpack_parser.extractor.read_file(pic_file)
-            specs = extract_device_specs_from_xml(pic_content, device_name)
-            all_specs.append(specs)
-        except Exception as e:
-            print(f"Warning: Failed to extract specs for {device_name}: {e}")
-            continue
-
-    # Sort by device name
-    all_specs.sort(key=lambda x: x.device_name)
     return all_specs
 
 
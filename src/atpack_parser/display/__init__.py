@@ -1,10 +1,44 @@
 """Shared display utilities for CLI and interactive mode."""
 
-from .memory import display_flat_memory, display_hierarchical_memory
-from .registers import display_registers
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 __all__ = [
     "display_flat_memory",
     "display_hierarchical_memory",
     "display_registers",
+    "get_console",
 ]
+
+_console: Optional["Console"] = None
+
+# Public name -> submodule, imported on first access so rich loads only when used
+_LAZY_EXPORTS = {
+    "display_flat_memory": "memory",
+    "display_hierarchical_memory": "memory",
+    "display_registers": "registers",
+}
+
+
+def get_console() -> "Console":
+    """Get the process-wide console, probing the terminal only on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,67 +1,93 @@
 """Shared memory display utilities for CLI and interactive mode."""
 
-from typing import List
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 from ..models import MemorySegment, MemorySpace
+from . import get_console
+from .styles import add_columns
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Bound formatters for the per-row address and size cells
+_HEX4 = "0x%04X".__mod__
+_COMMA_INT = "{:,}".format
+
+# Table columns as (header, style name)
+_HIERARCHICAL_COLUMNS = (
+    ("Memory Space/Segment", "cyan"),
+    ("Start Address", "green"),
+    ("End Address", "green"),
+    ("Size", "yellow"),
+    ("Type", "magenta"),
+    ("Page Size", "blue"),
+    ("Description", "dim"),
+)
+_FLAT_COLUMNS = (
+    ("Segment", "cyan"),
+    ("Start Address", "green"),
+    ("End Address", "green"),
+    ("Size", "yellow"),
+    ("Type", "magenta"),
+    ("Page Size", "blue"),
+    ("Address Space", "dim"),
+)
+
+
+def _iter_hierarchical_rows(
+    memory_spaces: List[MemorySpace],
+) -> Iterator[Tuple[str, ...]]:
+    """Yield each memory space header row followed by its segment rows."""
+    for space in memory_spaces:
+        # Memory space header
+        has_start = space.start is not None
+        yield (
+            f"📁 {space.name}",
+            _HEX4(space.start) if has_start else "N/A",
+            (
+                _HEX4(space.start + space.size - 1)
+                if has_start and space.size is not None
+                else "N/A"
+            ),
+            _COMMA_INT(space.size) if space.size is not None else "N/A",
+            space.space_type,
+            "N/A",
+            f"Container with {len(space.segments)} segment(s)",
+        )
+
+        # Child segments, indented with tree characters
+        for seg in space.segments:
+            yield (
+                f"  └── {seg.name}",
+                _HEX4(seg.start),
+                _HEX4(seg.start + seg.size - 1),
+                _COMMA_INT(seg.size),
+                seg.type or "N/A",
+                f"{seg.page_size}" if seg.page_size else "N/A",
+                seg.section or "N/A",
+            )
 
 
 def display_hierarchical_memory(
     memory_spaces: List[MemorySpace],
     device_name: str,
-    console: Console,
+    console: Optional["Console"] = None,
     no_color: bool = False,
 ) -> None:
     """Display memory spaces in a hierarchical table format."""
-    title = f"💾 Memory Layout: {device_name} (Hierarchical)"
+    from rich.table import Table
 
-    table = Table(title=title)
-    table.add_column("Memory Space/Segment", style="cyan" if not no_color else None)
-    table.add_column("Start Address", style="green" if not no_color else None)
-    table.add_column("End Address", style="green" if not no_color else None)
-    table.add_column("Size", style="yellow" if not no_color else None)
-    table.add_column("Type", style="magenta" if not no_color else None)
-    table.add_column("Page Size", style="blue" if not no_color else None)
-    table.add_column("Description", style="dim" if not no_color else None)
+    if console is None:
+        console = get_console()
 
-    for space in memory_spaces:
-        # Add memory space header
-        space_name = f"📁 {space.name}"
-        space_start = f"0x{space.start:04X}" if space.start is not None else "N/A"
-        space_end = (
-            f"0x{space.start + space.size - 1:04X}"
-            if (space.start is not None and space.size is not None)
-            else "N/A"
-        )
-        space_size = f"{space.size:,}" if space.size is not None else "N/A"
+    title = f"💾 Memory Layout: {device_name} (Hierarchical)"
 
-        table.add_row(
-            space_name,
-            space_start,
-            space_end,
-            space_size,
-            space.space_type,
-            "N/A",
-            f"Container with {len(space.segments)} segment(s)",
-        )
+    table = Table(title=title)
+    add_columns(table, _HIERARCHICAL_COLUMNS, no_color)
 
-        # Add child segments with indentation
-        for seg in space.segments:
-            end_addr = seg.start + seg.size - 1
-            page_size_str = f"{seg.page_size}" if seg.page_size else "N/A"
-            segment_name = f"  └── {seg.name}"  # Indented with tree characters
-
-            table.add_row(
-                segment_name,
-                f"0x{seg.start:04X}",
-                f"0x{end_addr:04X}",
-                f"{seg.size:,}",
-                seg.type or "N/A",
-                page_size_str,
-                seg.section or "N/A",
-            )
+    add_row = table.add_row
+    for row in _iter_hierarchical_rows(memory_spaces):
+        add_row(*row)
 
     console.print(table)
 
@@ -69,32 +95,34 @@ def display_hierarchical_memory(
 def display_flat_memory(
     memory_segments: List[MemorySegment],
     device_name: str,
-    console: Console,
+    console: Optional["Console"] = None,
     no_color: bool = False,
 ) -> None:
     """Display memory segments in a flat table format."""
+    from rich.table import Table
+
+    if console is None:
+        console = get_console()
+
     title = f"💾 Memory Layout: {device_name} (Flat)"
 
     table = Table(title=title)
-    table.add_column("Segment", style="cyan" if not no_color else None)
-    table.add_column("Start Address", style="green" if not no_color else None)
-    table.add_column("End Address", style="green" if not no_color else None)
-    table.add_column("Size", style="yellow" if not no_color else None)
-    table.add_column("Type", style="magenta" if not no_color else None)
-    table.add_column("Page Size", style="blue" if not no_color else None)
-    table.add_column("Address Space", style="dim" if not no_color else None)
-
-    for seg in memory_segments:
-        end_addr = seg.start + seg.size - 1
-        page_size_str = f"{seg.page_size}" if seg.page_size else "N/A"
-
-        table.add_row(
+    add_columns(table, _FLAT_COLUMNS, no_color)
+
+    # Derive the computed cells in their own passes, then format the rows
+    ends = [seg.start + seg.size - 1 for seg in memory_segments]
+    page_sizes = [
+        str(seg.page_size) if seg.page_size else "N/A" for seg in memory_segments
+    ]
+    add_row = table.add_row
+    for seg, end, page_size in zip(memory_segments, ends, page_sizes):
+        add_row(
             seg.name,
-            f"0x{seg.start:04X}",
-            f"0x{end_addr:04X}",
-            f"{seg.size:,}",
+            _HEX4(seg.start),
+            _HEX4(end),
+            _COMMA_INT(seg.size),
             seg.type or "N/A",
-            page_size_str,
+            page_size,
             seg.address_space or "N/A",
         )
 
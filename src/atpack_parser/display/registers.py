@@ -1,51 +1,69 @@
 """Shared register display utilities for CLI and interactive mode."""
 
-from rich.console import Console
-from rich.table import Table
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional
 
 from ..models import Device
+from . import get_console
+from .styles import add_columns
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Bound formatter for the per-row offset cell
+_HEX4 = "0x%04X".__mod__
+
+# Table columns as (header, style name)
+_REGISTER_COLUMNS = (
+    ("Module", "cyan"),
+    ("Register", "green"),
+    ("Offset", "yellow"),
+    ("Size", "blue"),
+    ("Access", "magenta"),
+    ("Bitfields", "dim"),
+)
 
 
 def display_registers(
     device: Device,
     device_name: str,
-    console: Console,
+    console: Optional["Console"] = None,
     no_color: bool = False,
     module_filter: str = None,
 ) -> None:
     """Display device registers in a table format."""
+    from rich.table import Table
+
+    if console is None:
+        console = get_console()
+
     title = f"📋 Registers: {device_name}"
     if module_filter:
         title += f" (Module: {module_filter})"
 
     table = Table(title=title)
-    table.add_column("Module", style="cyan" if not no_color else None)
-    table.add_column("Register", style="green" if not no_color else None)
-    table.add_column("Offset", style="yellow" if not no_color else None)
-    table.add_column("Size", style="blue" if not no_color else None)
-    table.add_column("Access", style="magenta" if not no_color else None)
-    table.add_column("Bitfields", style="dim" if not no_color else None)
-
-    # Collect registers from device modules
-    registers = []
-    for mod in device.modules:
-        if module_filter and mod.name.upper() != module_filter.upper():
-            continue
-        for rg in mod.register_groups:
-            for reg in rg.registers:
-                registers.append(
-                    {"module": mod.name, "group": rg.name, "register": reg}
-                )
+    add_columns(table, _REGISTER_COLUMNS, no_color)
+
+    # Collect (offset, module name, register) rows from device modules
+    module_key = module_filter.upper() if module_filter else None
+    registers = sorted(
+        (
+            (reg.offset, mod.name, reg)
+            for mod in device.modules
+            if not module_key or mod.name.upper() == module_key
+            for rg in mod.register_groups
+            for reg in rg.registers
+        ),
+        key=itemgetter(0),  # Sort by offset like CLI does
+    )
 
     if registers:
-        # Sort by offset like CLI does
-        sorted_registers = sorted(registers, key=lambda x: x["register"].offset)
-        for item in sorted_registers:
-            reg = item["register"]
-            table.add_row(
-                item["module"],
+        add_row = table.add_row
+        for offset, module_name, reg in registers:
+            add_row(
+                module_name,
                 reg.name,
-                f"0x{reg.offset:04X}",
+                _HEX4(offset),
                 str(reg.size),
                 reg.access or "RW",
                 str(len(reg.bitfields)),
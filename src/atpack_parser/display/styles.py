@@ -0,0 +1,25 @@
+"""Shared table column styles for CLI and interactive mode."""
+
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Rich styles used for table columns, with their no-color counterparts
+_STYLE_NAMES = ("cyan", "green", "yellow", "blue", "magenta", "red", "white", "dim")
+_COLOR_STYLES: Dict[str, Optional[str]] = {name: name for name in _STYLE_NAMES}
+_NO_COLOR_STYLES: Dict[str, Optional[str]] = dict.fromkeys(_STYLE_NAMES)
+
+
+def get_styles(no_color: bool = False) -> Dict[str, Optional[str]]:
+    """Get the column style lookup, mapping every style to None when color is off."""
+    return _NO_COLOR_STYLES if no_color else _COLOR_STYLES
+
+
+def add_columns(
+    table: "Table", columns: Iterable[Tuple[str, str]], no_color: bool = False
+) -> None:
+    """Add (header, style name) columns to a table, unstyled when color is off."""
+    styles = get_styles(no_color)
+    for header, style in columns:
+        table.add_column(header, style=styles[style])
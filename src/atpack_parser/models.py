@@ -1,9 +1,10 @@
 """Pydantic models for AtPack data structures."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DeviceFamily(str, Enum):
@@ -43,18 +44,6 @@ class GprSector(BaseModel):
     bank: Optional[str] = None
 
 
-class ElectricalParameter(BaseModel):
-    """Electrical parameter specification."""
-
-    name: str
-    min_value: Optional[float] = None
-    max_value: Optional[float] = None
-    typical_value: Optional[float] = None
-    nominal_value: Optional[float] = None
-    unit: Optional[str] = None
-    conditions: Optional[str] = None
-
-
 class PowerSpecification(BaseModel):
     """Power supply specifications for PIC devices."""
 
@@ -178,6 +167,8 @@ class AtmelGpioInfo(BaseModel):
 class MemorySegment(BaseModel):
     """Memory segment information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     start: int
     size: int
@@ -195,6 +186,8 @@ class MemorySegment(BaseModel):
 class MemorySpace(BaseModel):
     """Memory space/container information for hierarchical memory layout."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     space_type: str  # "ProgramSpace", "DataSpace", "EEDataSpace", "address-space", etc.
     start: Optional[int] = None
@@ -241,6 +234,11 @@ class Module(BaseModel):
     caption: Optional[str] = None
     register_groups: List[RegisterGroup] = Field(default_factory=list)
 
+    @cached_property
+    def total_registers(self) -> int:
+        """Total number of registers across all register groups."""
+        return sum(len(rg.registers) for rg in self.register_groups)
+
 
 class FuseBitfield(BaseModel):
     """Fuse bitfield information."""
@@ -306,6 +304,8 @@ class ConfigWord(BaseModel):
 class Device(BaseModel):
     """Device information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     family: DeviceFamily
     architecture: Optional[str] = None
@@ -350,6 +350,16 @@ class Device(BaseModel):
     # Additional metadata
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    @cached_property
+    def register_index(self) -> Dict[str, Register]:
+        """Registers by uppercase name, the first one in module order wins."""
+        index: Dict[str, Register] = {}
+        for mod in self.modules:
+            for rg in mod.register_groups:
+                for reg in rg.registers:
+                    index.setdefault(reg.name.upper(), reg)
+        return index
+
 
 class AtPackMetadata(BaseModel):
     """AtPack file metadata."""
@@ -364,10 +374,8 @@ class AtPackMetadata(BaseModel):
 class AtPack(BaseModel):
     """Complete AtPack information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     metadata: AtPackMetadata
     devices: List[Device] = Field(default_factory=list)
-    device_family: DeviceFamily = DeviceFamily.UNSUPPORTED
-
-
-# Forward reference for self-referential MemorySegment
-MemorySegment.model_rebuild()
+    device_family: Literal["ATMEL", "PIC", "UNSUPPORTED"] = "UNSUPPORTED"
@@ -1,6 +1,6 @@
 """ATMEL ATDF parser."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from lxml import etree
 
@@ -31,8 +31,8 @@ from .xml import XmlParser
 class AtdfParser:
     """Parser for ATMEL ATDF files."""
 
-    def __init__(self, xml_content: str):
-        """Initialize with XML content."""
+    def __init__(self, xml_content: Union[str, etree._Element]):
+        """Initialize with XML content or an already parsed root element."""
         self.parser = XmlParser(xml_content)
 
     def parse_device(self, device_name: Optional[str] = None) -> Device:
@@ -304,7 +304,7 @@ class AtdfParser:
             if bitfield:
                 bitfields.append(bitfield)
 
-        return Register(
+        return Register.model_construct(
             name=name,
             caption=caption,
             offset=offset,
@@ -338,7 +338,7 @@ class AtdfParser:
         if values_ref:
             values = self._parse_bitfield_values(values_ref)
 
-        return RegisterBitfield(
+        return RegisterBitfield.model_construct(
             name=name,
             caption=caption,
             mask=mask,
@@ -472,7 +472,9 @@ class AtdfParser:
             caption = self.parser.get_attr(int_element, "caption", "")
 
             if name:
-                interrupts.append(Interrupt(index=index, name=name, caption=caption))
+                interrupts.append(
+                    Interrupt.model_construct(index=index, name=name, caption=caption)
+                )
 
         return sorted(interrupts, key=lambda x: x.index)
 
@@ -502,7 +504,9 @@ class AtdfParser:
                         address = int(name[9:])
 
                     signatures.append(
-                        DeviceSignature(name=name, address=address, value=value)
+                        DeviceSignature.model_construct(
+                            name=name, address=address, value=value
+                        )
                     )
                 except ValueError:
                     pass
@@ -1,5 +1,6 @@
 """Main AtPack parser."""
 
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 
@@ -9,7 +10,7 @@ from ..exceptions import (
     ParseError,
     UnsupportedFormatError,
 )
-from ..models import AtPackMetadata, Device, DeviceFamily
+from ..models import AtPackMetadata, Device, DeviceFamily, Register
 from .pdsc import PdscParser
 from .pic import PicParser
 from ..atpack_extractor import AtPackExtractor
@@ -18,6 +19,14 @@ if TYPE_CHECKING:
     from ..models import DeviceSpecs
 
 
+def _files_by_name(files: List[str]) -> Dict[str, str]:
+    """Map uppercase file stems to paths, the first file wins for duplicates."""
+    by_name: Dict[str, str] = {}
+    for file_path in files:
+        by_name.setdefault(Path(file_path).stem.upper(), file_path)
+    return by_name
+
+
 class AtPackParser:
     """Main parser for AtPack files."""
 
@@ -28,6 +37,22 @@ class AtPackParser:
         self._metadata: Optional[AtPackMetadata] = None
         self._device_family: Optional[DeviceFamily] = None
         self._device_cache: Dict[str, Device] = {}
+        self._devices: Optional[List[str]] = None
+        self._registers_cache: Dict[str, List[Register]] = {}
+        self._pdsc_parser: Optional[PdscParser] = None
+        self._pdsc_loaded = False
+        self._atdf_by_name: Optional[Dict[str, str]] = None
+        self._pic_by_name: Optional[Dict[str, str]] = None
+
+    def __enter__(self) -> "AtPackParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the open AtPack archive."""
+        self.extractor.close()
 
     @property
     def metadata(self) -> AtPackMetadata:
@@ -43,14 +68,41 @@ class AtPackParser:
             self._device_family = self._detect_device_family()
         return self._device_family
 
+    @property
+    def _pdsc(self) -> Optional[PdscParser]:
+        """PDSC parser of the AtPack, or None if it has no PDSC file."""
+        if not self._pdsc_loaded:
+            pdsc_files = self.extractor.find_pdsc_files()
+            if pdsc_files:
+                pdsc_content = self.extractor.read_file(pdsc_files[0])
+                self._pdsc_parser = PdscParser(pdsc_content)
+            self._pdsc_loaded = True
+        return self._pdsc_parser
+
+    def _atdf_file(self, device_name: str) -> Optional[str]:
+        """Find the ATDF file of a device by case-insensitive name."""
+        if self._atdf_by_name is None:
+            self._atdf_by_name = _files_by_name(self.extractor.find_atdf_files())
+        return self._atdf_by_name.get(device_name.upper())
+
+    def _pic_file(self, device_name: str) -> Optional[str]:
+        """Find the PIC file of a device by case-insensitive name."""
+        if self._pic_by_name is None:
+            self._pic_by_name = _files_by_name(self.extractor.find_pic_files())
+        return self._pic_by_name.get(device_name.upper())
+
     def get_devices(self) -> List[str]:
         """Get list of all device names in the AtPack."""
+        if self._devices is None:
+            self._devices = self._list_devices()
+        return list(self._devices)
+
+    def _list_devices(self) -> List[str]:
+        """List device names from the PDSC file or the device files."""
         try:
             # Try to get from PDSC first
-            pdsc_files = self.extractor.find_pdsc_files()
-            if pdsc_files:
-                pdsc_content = self.extractor.read_file(pdsc_files[0])
-                pdsc_parser = PdscParser(pdsc_content)
+            pdsc_parser = self._pdsc
+            if pdsc_parser is not None:
                 devices = pdsc_parser.list_devices()
                 if devices:
                     return devices
@@ -97,19 +149,24 @@ class AtPackParser:
 
     def get_device_registers(self, device_name: str) -> List[Any]:
         """Get registers for a specific device."""
-        device = self.get_device(device_name)
-        registers = []
+        registers = self._registers_cache.get(device_name)
+        if registers is None:
+            device = self.get_device(device_name)
+            registers = []
+
+            for module in device.modules:
+                for reg_group in module.register_groups:
+                    registers.extend(reg_group.registers)
 
-        for module in device.modules:
-            for reg_group in module.register_groups:
-                registers.extend(reg_group.registers)
+            registers.sort(key=attrgetter("offset"))
+            self._registers_cache[device_name] = registers
 
-        return sorted(registers, key=lambda x: x.offset)
+        return list(registers)
 
     def get_device_memory(self, device_name: str) -> List[Any]:
         """Get memory segments for a specific device."""
         device = self.get_device(device_name)
-        return sorted(device.memory_segments, key=lambda x: x.start)
+        return sorted(device.memory_segments, key=attrgetter("start"))
 
     def get_device_memory_hierarchical(self, device_name: str) -> List[Any]:
         """Get hierarchical memory layout for a specific device."""
@@ -133,78 +190,48 @@ class AtPackParser:
         """List files in the AtPack."""
         return self.extractor.list_files(pattern)
 
+    def file_sizes(self, pattern: Optional[str] = None) -> Dict[str, int]:
+        """Get sizes in bytes of files in the AtPack."""
+        return self.extractor.file_sizes(pattern)
+
     def read_file(self, file_path: str) -> str:
         """Read a file from the AtPack."""
         return self.extractor.read_file(file_path)
 
     def get_device_specs(self, device_name: str) -> "DeviceSpecs":
         """Get comprehensive device specifications for a specific device."""
-        from ..models import DeviceFamily
-        from .pic import PicParser
-        from pathlib import Path
-
         if self.device_family != DeviceFamily.PIC:
             raise ValueError(
                 "Device specifications extraction is currently only supported for PIC devices"
             )
 
         # Find PIC file for device
-        pic_files = self.extractor.find_pic_files()
-
-        pic_file = None
-        for file_path in pic_files:
-            file_name = Path(file_path).stem
-            if file_name.upper() == device_name.upper():
-                pic_file = file_path
-                break
+        pic_file = self._pic_file(device_name)
 
         if not pic_file:
             raise ValueError(f"PIC file for device '{device_name}' not found")
 
-        # Read PIC file content and extract specs
-        pic_content = self.extractor.read_file(pic_file)
-        parser = PicParser(pic_content)
+        # Parse PIC file (or reuse its cached tree) and extract specs
+        parser = PicParser(self.extractor.read_xml(pic_file))
         return parser.extract_device_specs(device_name)
 
-    def get_all_device_specs(self) -> List["DeviceSpecs"]:
+    def get_all_device_specs(
+        self, parallel: bool = False, use_cache: bool = False
+    ) -> List["DeviceSpecs"]:
         """Get comprehensive device specifications for all devices in the AtPack."""
-        from ..models import DeviceFamily
-        from .pic import PicParser
-        from pathlib import Path
-
-        if self.device_family != DeviceFamily.PIC:
-            raise ValueError(
-                "Device specifications extraction is currently only supported for PIC devices"
-            )
-
-        all_specs = []
-        pic_files = self.extractor.find_pic_files()
-
-        for pic_file in pic_files:
-            device_name = Path(pic_file).stem
-
-            # Skip Application Support files that start with AC162
-            if device_name.startswith("AC162"):
-                continue
+        from ..device_specs import extract_all_device_specs_from_atpack
 
-            try:
-                pic_content = self.extractor.read_file(pic_file)
-                parser = PicParser(pic_content)
-                specs = parser.extract_device_specs(device_name)
-                all_specs.append(specs)
-            except Exception as e:
-                print(f"Warning: Failed to extract specs for {device_name}: {e}")
-                continue
-
-        # Sort by device name
-        all_specs.sort(key=lambda x: x.device_name)
-        return all_specs
+        return extract_all_device_specs_from_atpack(
+            self, parallel=parallel, use_cache=use_cache
+        )
 
     def _parse_metadata(self) -> AtPackMetadata:
         """Parse AtPack metadata from PDSC file."""
-        pdsc_files = self.extractor.find_pdsc_files()
+        try:
+            pdsc_parser = self._pdsc
+            if pdsc_parser is not None:
+                return pdsc_parser.parse_metadata()
 
-        if not pdsc_files:
             # Create minimal metadata
             return AtPackMetadata(
                 name=self.atpack_path.stem,
@@ -213,11 +240,6 @@ class AtPackParser:
                 version="0.0.0",
             )
 
-        try:
-            pdsc_content = self.extractor.read_file(pdsc_files[0])
-            pdsc_parser = PdscParser(pdsc_content)
-            return pdsc_parser.parse_metadata()
-
         except Exception:
             # Return minimal metadata if parsing fails
             return AtPackMetadata(
@@ -231,10 +253,8 @@ class AtPackParser:
         """Detect device family from AtPack contents."""
         try:
             # Try PDSC first
-            pdsc_files = self.extractor.find_pdsc_files()
-            if pdsc_files:
-                pdsc_content = self.extractor.read_file(pdsc_files[0])
-                pdsc_parser = PdscParser(pdsc_content)
+            pdsc_parser = self._pdsc
+            if pdsc_parser is not None:
                 family = pdsc_parser.detect_device_family()
                 if family != DeviceFamily.UNSUPPORTED:
                     return family
@@ -273,21 +293,13 @@ class AtPackParser:
     def _parse_atmel_device(self, device_name: str) -> Device:
         """Parse ATMEL device from ATDF file."""
         # Find ATDF file for device
-        atdf_files = self.extractor.find_atdf_files()
-
-        atdf_file = None
-        for file_path in atdf_files:
-            file_name = Path(file_path).stem
-            if file_name.upper() == device_name.upper():
-                atdf_file = file_path
-                break
+        atdf_file = self._atdf_file(device_name)
 
         if not atdf_file:
             raise DeviceNotFoundError(f"ATDF file for device '{device_name}' not found")
 
         try:
-            atdf_content = self.extractor.read_file(atdf_file)
-            atdf_parser = AtdfParser(atdf_content)
+            atdf_parser = AtdfParser(self.extractor.read_xml(atdf_file))
             return atdf_parser.parse_device(device_name)
 
         except Exception as e:
@@ -296,21 +308,13 @@ class AtPackParser:
     def _parse_pic_device(self, device_name: str) -> Device:
         """Parse PIC device from .pic file."""
         # Find PIC file for device
-        pic_files = self.extractor.find_pic_files()
-
-        pic_file = None
-        for file_path in pic_files:
-            file_name = Path(file_path).stem
-            if file_name.upper() == device_name.upper():
-                pic_file = file_path
-                break
+        pic_file = self._pic_file(device_name)
 
         if not pic_file:
             raise DeviceNotFoundError(f"PIC file for device '{device_name}' not found")
 
         try:
-            pic_content = self.extractor.read_file(pic_file)
-            pic_parser = PicParser(pic_content)
+            pic_parser = PicParser(self.extractor.read_xml(pic_file))
             return pic_parser.parse_device(device_name)
 
         except Exception as e:
@@ -1,10 +1,26 @@
 """PDSC (Package Description) parser for AtPack metadata."""
 
+import re
 from typing import List, Optional
 
+from lxml import etree
+
 from ..models import AtPackMetadata, DeviceFamily
 from .xml import XmlParser
 
+# Device, subfamily device and variant names in one document walk
+_DEVICE_NAMES_XPATH = etree.XPath(
+    "//devices/family/device/@Dname"
+    " | //devices/family/subFamily/device/@Dname"
+    " | //devices/family/device/variant/@Dvariant"
+)
+_CORES_AND_FAMILIES_XPATH = etree.XPath("//device/@Dcore | //family/@Dfamily")
+
+# Typical ATMEL processors and families. Cortex cores alone do not make a
+# pack ATMEL, Microchip PIC32C packs use them too.
+_ATMEL_PROCESSOR_RE = re.compile(r"ARM|AVR", re.IGNORECASE)
+_ATMEL_FAMILY_RE = re.compile(r"AVR|SAM|MEGA|TINY", re.IGNORECASE)
+
 
 class PdscParser:
     """Parser for PDSC files containing AtPack metadata."""
@@ -32,26 +48,8 @@ class PdscParser:
 
     def list_devices(self) -> List[str]:
         """List all device names mentioned in PDSC."""
-        device_names = []
-
-        # Look for device definitions
-        devices = self.parser.xpath("//devices/family/device/@Dname")
-        device_names.extend([name for name in devices if isinstance(name, str)])
-
-        # Also look for subfamily devices
-        subfamily_devices = self.parser.xpath(
-            "//devices/family/subFamily/device/@Dname"
-        )
-        device_names.extend(
-            [name for name in subfamily_devices if isinstance(name, str)]
-        )
-
-        # Look for variant devices
-        variant_devices = self.parser.xpath("//devices/family/device/variant/@Dvariant")
-        device_names.extend([name for name in variant_devices if isinstance(name, str)])
-
-        # Remove duplicates and sort
-        return sorted(list(set(device_names)))
+        names = _DEVICE_NAMES_XPATH(self.parser.tree)
+        return sorted({str(name) for name in names if isinstance(name, str)})
 
     def get_device_info(self, device_name: str) -> Optional[dict]:
         """Get basic device information from PDSC."""
@@ -101,24 +99,14 @@ class PdscParser:
         elif "MICROCHIP" in vendor:
             # Could be either ATMEL (acquired by Microchip) or PIC
             # Check device families or processor types
-            processors = self.parser.xpath("//device/@Dcore")
-            families = self.parser.xpath("//family/@Dfamily")
-
-            # Check for typical ATMEL processors
-            atmel_processors = ["ARM", "AVR", "Cortex"]
-            for proc in processors:
-                if isinstance(proc, str):
-                    for atmel_proc in atmel_processors:
-                        if atmel_proc in proc.upper():
-                            return DeviceFamily.ATMEL
-
-            # Check for typical ATMEL families
-            atmel_families = ["AVR", "SAM", "MEGA", "TINY"]
-            for family in families:
-                if isinstance(family, str):
-                    for atmel_fam in atmel_families:
-                        if atmel_fam in family.upper():
-                            return DeviceFamily.ATMEL
+            for value in _CORES_AND_FAMILIES_XPATH(self.parser.tree):
+                pattern = (
+                    _ATMEL_PROCESSOR_RE
+                    if value.attrname == "Dcore"
+                    else _ATMEL_FAMILY_RE
+                )
+                if pattern.search(value):
+                    return DeviceFamily.ATMEL
 
             # Default to PIC for Microchip
             return DeviceFamily.PIC
@@ -1,6 +1,6 @@
 """Microchip PIC parser."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from lxml import etree
 
@@ -29,6 +29,40 @@ from ..models import (
 )
 from .xml import XmlParser
 
+# Compiled once, evaluated against every device in an AtPack
+_EDC_NAMESPACES = {"edc": "http://crownking/edc"}
+_XP_PROGRAM_SPACE = etree.XPath(".//edc:ProgramSpace", namespaces=_EDC_NAMESPACES)
+_XP_DATA_SPACE = etree.XPath(".//edc:DataSpace", namespaces=_EDC_NAMESPACES)
+_XP_CODE_SECTOR = etree.XPath(".//edc:CodeSector", namespaces=_EDC_NAMESPACES)
+_XP_GPR_SECTOR = etree.XPath(".//edc:GPRDataSector", namespaces=_EDC_NAMESPACES)
+
+
+# Namespaced attribute keys read directly from element.attrib in hot loops
+_EDC_BEGINADDR = "{http://crownking/edc}beginaddr"
+_EDC_ENDADDR = "{http://crownking/edc}endaddr"
+_EDC_SHADOWIDREF = "{http://crownking/edc}shadowidref"
+
+
+def _attrib_hex(attrib, name: str, edc_name: str) -> int:
+    """Parse a hex address attribute, plain or EDC namespaced, defaulting to 0."""
+    value = attrib.get(name) or attrib.get(edc_name)
+    try:
+        return int(value, 16) if value else 0
+    except ValueError:
+        return 0
+
+
+def _is_shadow(attrib) -> bool:
+    """Check for a shadowidref attribute, marking a mirror of another region."""
+    return "shadowidref" in attrib or _EDC_SHADOWIDREF in attrib
+
+
+def _edc_descendants(
+    xpath: etree.XPath, tag: str, element: etree._Element
+) -> List[etree._Element]:
+    """Find EDC descendants, falling back to any namespace when none match."""
+    return xpath(element) or list(element.iterdescendants(f"{{*}}{tag}"))
+
 
 class PicParser:
     """Parser for Microchip PIC files."""
@@ -36,8 +70,8 @@ class PicParser:
     # EDC namespace constant to avoid repetition
     EDC_NS = "http://crownking/edc"
 
-    def __init__(self, xml_content: str):
-        """Initialize with XML content."""
+    def __init__(self, xml_content: Union[str, etree._Element]):
+        """Initialize with XML content or an already parsed root element."""
         self.parser = XmlParser(xml_content)
 
     def _edc_ns(self, attr: str) -> str:
@@ -140,14 +174,12 @@ class PicParser:
         segments = []
 
         # Parse ProgramSpace - contains CodeSector elements for program memory
-        program_space = self.parser.xpath(
-            './/edc:ProgramSpace | .//*[local-name()="ProgramSpace"]', device_element
+        program_space = _edc_descendants(
+            _XP_PROGRAM_SPACE, "ProgramSpace", device_element
         )
         for ps in program_space:
             # Parse CodeSector elements
-            code_sectors = self.parser.xpath(
-                './/edc:CodeSector | .//*[local-name()="CodeSector"]', ps
-            )
+            code_sectors = _edc_descendants(_XP_CODE_SECTOR, "CodeSector", ps)
             for cs in code_sectors:
                 start = self.parser.get_attr_hex(cs, "beginaddr", 0)
                 end = self.parser.get_attr_hex(cs, "endaddr", 0)
@@ -166,9 +198,7 @@ class PicParser:
                     )
 
         # Parse DataSpace - contains SFRDataSector and other data memory
-        data_space = self.parser.xpath(
-            './/edc:DataSpace | .//*[local-name()="DataSpace"]', device_element
-        )
+        data_space = _edc_descendants(_XP_DATA_SPACE, "DataSpace", device_element)
         for ds in data_space:
             # Parse SFRDataSector elements
             sfr_sectors = self.parser.xpath(
@@ -192,18 +222,10 @@ class PicParser:
                     )
 
             # Parse GPRDataSector elements (General Purpose Registers)
-            gpr_sectors = self.parser.xpath(
-                './/edc:GPRDataSector | .//*[local-name()="GPRDataSector"]', ds
-            )
+            gpr_sectors = _edc_descendants(_XP_GPR_SECTOR, "GPRDataSector", ds)
             for gpr in gpr_sectors:
                 # Skip shadow sectors (they are mirrors of other memory regions)
-                # Check for shadowidref attribute with both namespace and local name approaches
-                shadow_ref = (
-                    self.parser.get_attr(gpr, "shadowidref")
-                    or self.parser.get_attr(gpr, self._edc_ns("shadowidref"))
-                    or gpr.get(self._edc_ns("shadowidref"))
-                )
-                if shadow_ref is not None:
+                if _is_shadow(gpr.attrib):
                     continue
 
                 start = self.parser.get_attr_hex(gpr, "beginaddr", 0)
@@ -390,7 +412,7 @@ class PicParser:
                                 temp_mask >>= 1
                             actual_mask = field_mask
 
-                        bitfield = RegisterBitfield(
+                        bitfield = RegisterBitfield.model_construct(
                             name=field_name,
                             caption=field_desc or field_name,
                             mask=actual_mask,
@@ -447,7 +469,7 @@ class PicParser:
                                     else field_mask
                                 )
 
-                                bitfield = RegisterBitfield(
+                                bitfield = RegisterBitfield.model_construct(
                                     name=field_name,
                                     caption=field_desc or field_name,
                                     mask=actual_mask,
@@ -472,7 +494,7 @@ class PicParser:
             elif "-" in access_pattern:
                 access_mode = "R"  # Read-only for unmapped bits
 
-            register = Register(
+            register = Register.model_construct(
                 name=reg_name,
                 caption=description or reg_name,
                 offset=reg_addr,
@@ -533,7 +555,7 @@ class PicParser:
                             if val_name:
                                 values[val_value] = val_desc or val_name
 
-                        bitfield = RegisterBitfield(
+                        bitfield = RegisterBitfield.model_construct(
                             name=field_name,
                             caption=field_desc or field_name,
                             mask=field_mask,
@@ -577,7 +599,9 @@ class PicParser:
 
                 if name:
                     interrupts.append(
-                        Interrupt(index=vector, name=name, caption=desc or name)
+                        Interrupt.model_construct(
+                            index=vector, name=name, caption=desc or name
+                        )
                     )
 
         # If no explicit interrupts found, try to infer from common PIC interrupt registers
@@ -642,7 +666,7 @@ class PicParser:
             # Create interrupt objects from the discovered sources
             for i, int_name in enumerate(sorted(interrupt_sources)):
                 interrupts.append(
-                    Interrupt(
+                    Interrupt.model_construct(
                         index=i, name=f"{int_name}_INT", caption=f"{int_name} Interrupt"
                     )
                 )
@@ -669,7 +693,7 @@ class PicParser:
 
             if value > 0:
                 signatures.append(
-                    DeviceSignature(
+                    DeviceSignature.model_construct(
                         address=addr,
                         value=value,
                         mask=mask,
@@ -1191,16 +1215,14 @@ class PicParser:
         memory_spaces = []
 
         # Parse ProgramSpace - contains CodeSector elements for program memory
-        program_spaces = self.parser.xpath(
-            './/edc:ProgramSpace | .//*[local-name()="ProgramSpace"]', device_element
+        program_spaces = _edc_descendants(
+            _XP_PROGRAM_SPACE, "ProgramSpace", device_element
         )
         for ps in program_spaces:
             segments = []
 
             # Parse all types of sectors within ProgramSpace
-            code_sectors = self.parser.xpath(
-                './/edc:CodeSector | .//*[local-name()="CodeSector"]', ps
-            )
+            code_sectors = _edc_descendants(_XP_CODE_SECTOR, "CodeSector", ps)
             for cs in code_sectors:
                 start = self.parser.get_attr_hex(cs, "beginaddr", 0)
                 end = self.parser.get_attr_hex(cs, "endaddr", 0)
@@ -1278,9 +1300,7 @@ class PicParser:
                 )
 
         # Parse DataSpace - contains SFRDataSector and other data memory
-        data_spaces = self.parser.xpath(
-            './/edc:DataSpace | .//*[local-name()="DataSpace"]', device_element
-        )
+        data_spaces = _edc_descendants(_XP_DATA_SPACE, "DataSpace", device_element)
         for ds in data_spaces:
             segments = []
 
@@ -1309,18 +1329,10 @@ class PicParser:
                     )
 
             # Parse GPRDataSector elements (General Purpose Registers)
-            gpr_sectors = self.parser.xpath(
-                './/edc:GPRDataSector | .//*[local-name()="GPRDataSector"]', ds
-            )
+            gpr_sectors = _edc_descendants(_XP_GPR_SECTOR, "GPRDataSector", ds)
             for gpr in gpr_sectors:
                 # Skip shadow sectors (they are mirrors of other memory regions)
-                # Check for shadowidref attribute with both namespace and local name approaches
-                shadow_ref = (
-                    self.parser.get_attr(gpr, "shadowidref")
-                    or self.parser.get_attr(gpr, self._edc_ns("shadowidref"))
-                    or gpr.get(self._edc_ns("shadowidref"))
-                )
-                if shadow_ref is not None:
+                if _is_shadow(gpr.attrib):
                     continue
 
                 start = self.parser.get_attr_hex(gpr, "beginaddr", 0)
@@ -1499,149 +1511,72 @@ class PicParser:
             series=series,
         )
 
-        # Extract program memory size (Flash)
-        self._extract_specs_program_memory(device_element, specs)
-
-        # Extract RAM size from GPR sectors
-        self._extract_specs_ram_memory(device_element, specs)
-
-        # Extract EEPROM information
-        self._extract_specs_eeprom_memory(device_element, specs)
-
-        # Extract configuration memory
-        self._extract_specs_config_memory(device_element, specs)
+        # Extract Flash, RAM/GPR, EEPROM and configuration memory in one walk
+        self._extract_specs_memory(device_element, specs)
 
         return specs
 
-    def _extract_specs_program_memory(
+    def _extract_specs_memory(
         self, device_element: etree._Element, specs: "DeviceSpecs"
     ) -> None:
-        """Extract program memory information with proper shadow sector handling."""
-        program_space = self.parser.xpath(
-            './/edc:ProgramSpace | .//*[local-name()="ProgramSpace"]', device_element
-        )
-
-        if not program_space:
-            return
+        """Extract memory sizes from each memory space subtree in a single pass.
 
-        max_flash = 0
-        for ps in program_space:
-            # Look for CodeSector elements
-            code_sectors = self.parser.xpath(
-                './/edc:CodeSector | .//*[local-name()="CodeSector"]', ps
-            )
-            for code_sector in code_sectors:
-                # Skip shadow sectors (they are mirrors of other memory regions)
-                shadow_ref = (
-                    self.parser.get_attr(code_sector, "shadowidref")
-                    or self.parser.get_attr(code_sector, self._edc_ns("shadowidref"))
-                    or code_sector.get(self._edc_ns("shadowidref"))
-                )
-                if shadow_ref is not None:
-                    continue
-
-                begin_addr = self.parser.get_attr_hex(code_sector, "beginaddr", 0)
-                end_addr = self.parser.get_attr_hex(code_sector, "endaddr", 0)
-                sector_size = end_addr - begin_addr
-                max_flash += sector_size
-
-        specs.maximum_size = max_flash
-
-    def _extract_specs_ram_memory(
-        self, device_element: etree._Element, specs: "DeviceSpecs"
-    ) -> None:
-        """Extract RAM memory information including GPR sectors with shadow sector handling."""
+        Shadow code and GPR sectors (mirrors of other memory regions) are
+        skipped, and only the first non-empty EEPROM and config sectors are kept.
+        """
         from ..models import GprSector
 
-        data_space = self.parser.xpath(
-            './/edc:DataSpace | .//*[local-name()="DataSpace"]', device_element
-        )
-
-        if not data_space:
-            return
-
+        max_flash = 0
         total_ram = 0
         gpr_sectors = []
-
-        for ds in data_space:
-            # Look for GPRDataSector elements (General Purpose Register sectors)
-            gpr_data_sectors = self.parser.xpath(
-                './/edc:GPRDataSector | .//*[local-name()="GPRDataSector"]', ds
+        has_data_space = False
+
+        for space in device_element.iterdescendants("{*}ProgramSpace", "{*}DataSpace"):
+            in_program_space = etree.QName(space).localname == "ProgramSpace"
+            has_data_space = has_data_space or not in_program_space
+            sector_tags = (
+                ("{*}CodeSector", "{*}EEDataSector", "{*}ConfigFuseSector")
+                if in_program_space
+                else ("{*}GPRDataSector",)
             )
 
-            for gpr_sector in gpr_data_sectors:
-                # Skip shadow sectors (they are mirrors of other memory regions)
-                # Check for shadowidref attribute with both namespace and local name approaches
-                shadow_ref = (
-                    self.parser.get_attr(gpr_sector, "shadowidref")
-                    or self.parser.get_attr(gpr_sector, self._edc_ns("shadowidref"))
-                    or gpr_sector.get(self._edc_ns("shadowidref"))
-                )
-                if shadow_ref is not None:
-                    continue
-
-                begin_addr = self.parser.get_attr_hex(gpr_sector, "beginaddr", 0)
-                end_addr = self.parser.get_attr_hex(gpr_sector, "endaddr", 0)
-                sector_size = end_addr - begin_addr
-                bank = self.parser.get_attr(gpr_sector, "bank", "0")
-
-                if sector_size > 0:
-                    total_ram += sector_size
-
-                    gpr_info = GprSector(
-                        name=f"GPR_BANK{bank}",
-                        start_addr=begin_addr,
-                        end_addr=end_addr,
-                        size=sector_size,
-                        bank=bank,
-                    )
-                    gpr_sectors.append(gpr_info)
-
-        specs.maximum_ram_size = total_ram
-        specs.gpr_total_size = total_ram
-        specs.gpr_sectors = gpr_sectors
-
-    def _extract_specs_eeprom_memory(
-        self, device_element: etree._Element, specs: "DeviceSpecs"
-    ) -> None:
-        """Extract EEPROM memory information."""
-        # EEPROM is typically in ProgramSpace for PIC devices
-        program_space = self.parser.xpath(
-            './/edc:ProgramSpace | .//*[local-name()="ProgramSpace"]', device_element
-        )
-
-        for ps in program_space:
-            eeprom_sectors = self.parser.xpath(
-                './/edc:EEDataSector | .//*[local-name()="EEDataSector"]', ps
-            )
-
-            for eeprom_sector in eeprom_sectors:
-                eeprom_begin = self.parser.get_attr_hex(eeprom_sector, "beginaddr", 0)
-                eeprom_end = self.parser.get_attr_hex(eeprom_sector, "endaddr", 0)
-
-                if eeprom_end > eeprom_begin:
-                    specs.eeprom_addr = f"0x{eeprom_begin:04X}"
-                    specs.eeprom_size = eeprom_end - eeprom_begin
-                    break  # Take the first EEPROM sector found
-
-    def _extract_specs_config_memory(
-        self, device_element: etree._Element, specs: "DeviceSpecs"
-    ) -> None:
-        """Extract configuration memory information."""
-        program_space = self.parser.xpath(
-            './/edc:ProgramSpace | .//*[local-name()="ProgramSpace"]', device_element
-        )
-
-        for ps in program_space:
-            config_sectors = self.parser.xpath(
-                './/edc:ConfigFuseSector | .//*[local-name()="ConfigFuseSector"]', ps
-            )
+            for sector in space.iterdescendants(*sector_tags):
+                tag = etree.QName(sector).localname
+                attrib = sector.attrib
+                begin_addr = _attrib_hex(attrib, "beginaddr", _EDC_BEGINADDR)
+                end_addr = _attrib_hex(attrib, "endaddr", _EDC_ENDADDR)
+
+                if tag in ("CodeSector", "GPRDataSector"):
+                    if _is_shadow(attrib):
+                        continue
+
+                    sector_size = end_addr - begin_addr
+                    if tag == "CodeSector":
+                        max_flash += sector_size
+                    elif sector_size > 0:
+                        bank = self.parser.get_attr(sector, "bank", "0")
+                        total_ram += sector_size
+                        gpr_sectors.append(
+                            GprSector(
+                                name=f"GPR_BANK{bank}",
+                                start_addr=begin_addr,
+                                end_addr=end_addr,
+                                size=sector_size,
+                                bank=bank,
+                            )
+                        )
 
-            for config_sector in config_sectors:
-                config_begin = self.parser.get_attr_hex(config_sector, "beginaddr", 0)
-                config_end = self.parser.get_attr_hex(config_sector, "endaddr", 0)
+                elif end_addr <= begin_addr:
+                    continue
+                elif tag == "EEDataSector" and specs.eeprom_addr is None:
+                    specs.eeprom_addr = f"0x{begin_addr:04X}"
+                    specs.eeprom_size = end_addr - begin_addr
+                elif tag == "ConfigFuseSector" and specs.config_addr is None:
+                    specs.config_addr = f"0x{begin_addr:04X}"
+                    specs.config_size = end_addr - begin_addr
 
-                if config_end > config_begin:
-                    specs.config_addr = f"0x{config_begin:04X}"
-                    specs.config_size = config_end - config_begin
-                    break  # Take the first config sector found
+        specs.maximum_size = max_flash
+        if has_data_space:
+            specs.maximum_ram_size = total_ram
+            specs.gpr_total_size = total_ram
+            specs.gpr_sectors = gpr_sectors
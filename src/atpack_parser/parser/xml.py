@@ -3,7 +3,7 @@
 import os
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from lxml import etree
 
@@ -13,10 +13,13 @@ from ..exceptions import ParseError
 class XmlParser:
     """XML parser with XPath utilities."""
 
-    def __init__(self, xml_content: str):
-        """Initialize parser with XML content."""
+    def __init__(self, xml_content: Union[str, etree._Element]):
+        """Initialize parser with XML content or an already parsed root element."""
         try:
-            self.tree = etree.fromstring(xml_content.encode("utf-8"))
+            if isinstance(xml_content, etree._Element):
+                self.tree = xml_content
+            else:
+                self.tree = etree.fromstring(xml_content.encode("utf-8"))
 
             # Extract namespaces from the root element
             self.namespaces = {}
@@ -28,6 +31,9 @@ class XmlParser:
             if "edc" not in self.namespaces:
                 self.namespaces["edc"] = "http://crownking/edc"
 
+            # Attribute name -> names to try, filled in on first lookup
+            self._attr_names: Dict[str, Tuple[str, ...]] = {}
+
         except etree.XMLSyntaxError as e:
             raise ParseError(f"Invalid XML content: {e}")
 
@@ -59,18 +65,21 @@ class XmlParser:
         self, element: etree._Element, attr_name: str, default: Optional[str] = None
     ) -> Optional[str]:
         """Get attribute value from element, trying both namespaced and non-namespaced versions."""
-        # Try without namespace first
-        value = element.get(attr_name)
-        if value is not None:
-            return value
-
-        # Try with each registered namespace
-        for prefix, namespace in self.namespaces.items():
-            if prefix:  # Skip empty prefix
-                namespaced_attr = f"{{{namespace}}}{attr_name}"
-                value = element.get(namespaced_attr)
-                if value is not None:
-                    return value
+        names = self._attr_names.get(attr_name)
+        if names is None:
+            # Plain name first, then the name in each registered namespace
+            names = (attr_name,) + tuple(
+                f"{{{namespace}}}{attr_name}"
+                for prefix, namespace in self.namespaces.items()
+                if prefix  # Skip empty prefix
+            )
+            self._attr_names[attr_name] = names
+
+        get = element.get
+        for name in names:
+            value = get(name)
+            if value is not None:
+                return value
 
         return default
 
@@ -78,18 +87,22 @@ class XmlParser:
         self, element: etree._Element, attr_name: str, default: int = 0
     ) -> int:
         """Get integer attribute value from element."""
-        value = self.get_attr(element, attr_name, str(default))
+        value = self.get_attr(element, attr_name)
+        if value is None:
+            return default
         try:
             return int(value, 16) if value.startswith("0x") else int(value)
-        except (ValueError, TypeError):
+        except ValueError:
             return default
 
     def get_attr_hex(
         self, element: etree._Element, attr_name: str, default: int = 0
     ) -> int:
         """Get hex attribute value from element."""
-        value = self.get_attr(element, attr_name, f"0x{default:x}")
+        value = self.get_attr(element, attr_name)
+        if value is None:
+            return default
         try:
-            return int(value, 16) if value.startswith("0x") else int(value, 16)
-        except (ValueError, TypeError):
+            return int(value, 16)
+        except ValueError:
             return default
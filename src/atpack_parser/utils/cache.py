@@ -0,0 +1,61 @@
+"""On-disk pickle cache for results derived from AtPack zip files."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from .. import __version__
+
+# Cache directory, following the XDG base directory convention
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "atpack_parser"
+)
+
+
+def cache_file(atpack_path: Path, kind: str) -> Optional[Path]:
+    """Cache file for a result derived from an AtPack zip file.
+
+    The key covers the resolved path, modification time and size of the
+    AtPack and the package version, so both changed packs and parser fixes
+    invalidate old entries. Extracted directories have no reliable mtime and
+    are never cached, for them None is returned.
+    """
+    if not atpack_path.is_file():
+        return None
+
+    resolved = atpack_path.resolve()
+    stat = resolved.stat()
+    key = hashlib.blake2b(
+        f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}:{__version__}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    return CACHE_DIR / f"{kind}-{key}.pkl"
+
+
+def load(path: Path) -> Any:
+    """Load a cached object, None if it is missing or unreadable."""
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or outdated cache entry
+        return None
+
+
+def store(path: Path, obj: Any) -> None:
+    """Save an object atomically, ignoring errors since caching is optional."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(obj, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except Exception:
+        pass
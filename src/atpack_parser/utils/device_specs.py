@@ -1,6 +1,7 @@
 """Utilities for extracting device specifications from configuration data."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -82,6 +83,7 @@ def get_max_frequency_from_oscillators(
     return format_frequency(max_frequencies[0])
 
 
+@lru_cache(maxsize=4096)
 def get_device_default_frequency(device_name: str) -> str:
     """Get default maximum frequency for a device based on its name/series."""
     specs = _load_device_specs()
@@ -100,6 +102,7 @@ def get_device_default_frequency(device_name: str) -> str:
     return "N/A"
 
 
+@lru_cache(maxsize=4096)
 def get_temperature_range_from_device_name(device_name: str) -> str:
     """Extract temperature range from device name using suffix patterns."""
     specs = _load_device_specs()
@@ -130,6 +133,7 @@ def get_temperature_range_from_device_name(device_name: str) -> str:
     return "N/A"
 
 
+@lru_cache(maxsize=4096)
 def get_device_default_vdd_range(device_name: str) -> str:
     """Get default VDD range for a device based on its name/series."""
     specs = _load_device_specs()
@@ -1,15 +1,40 @@
 """Unit handling utilities using pint for consistent unit management and display."""
 
-from typing import Union
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Union
 
-import pint
+if TYPE_CHECKING:
+    import pint
 
-# Create a unit registry instance
-ureg = pint.UnitRegistry()
-ureg.define("Hz = hertz")  # Ensure Hz is defined
 
+def _pint() -> ModuleType:
+    """Import pint on first use, it is slow to import."""
+    import pint
 
-def parse_frequency(frequency_str: str) -> pint.Quantity:
+    return pint
+
+
+@lru_cache(maxsize=None)
+def _get_ureg() -> "pint.UnitRegistry":
+    """Create the unit registry on first use.
+
+    Importing pint and building its registry takes a large part of the CLI
+    startup time, most commands never format a unit.
+    """
+    ureg = _pint().UnitRegistry()
+    ureg.define("Hz = hertz")  # Ensure Hz is defined
+    return ureg
+
+
+def __getattr__(name: str) -> "pint.UnitRegistry":
+    # Keep `ureg` importable from this module without creating it at import
+    if name == "ureg":
+        return _get_ureg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def parse_frequency(frequency_str: str) -> "pint.Quantity":
     """Parse a frequency string into a pint Quantity.
 
     Args:
@@ -18,9 +43,10 @@ def parse_frequency(frequency_str: str) -> pint.Quantity:
     Returns:
         pint.Quantity: The parsed frequency quantity
     """
+    ureg = _get_ureg()
     try:
         return ureg.Quantity(frequency_str)
-    except (ValueError, pint.UndefinedUnitError):
+    except (ValueError, _pint().UndefinedUnitError):
         # Try to parse as number + Hz if no unit specified
         try:
             value = float(frequency_str.replace(" Hz", "").replace("Hz", ""))
@@ -30,7 +56,9 @@ def parse_frequency(frequency_str: str) -> pint.Quantity:
             return frequency_str
 
 
-def format_frequency(frequency: Union[str, pint.Quantity], compact: bool = True) -> str:
+def format_frequency(
+    frequency: Union[str, "pint.Quantity"], compact: bool = True
+) -> str:
     """Format frequency for display with appropriate units.
 
     Args:
@@ -73,7 +101,7 @@ def format_frequency(frequency: Union[str, pint.Quantity], compact: bool = True)
         return str(freq_qty)
 
 
-def parse_voltage(voltage_str: str) -> Union[pint.Quantity, str]:
+def parse_voltage(voltage_str: str) -> Union["pint.Quantity", str]:
     """Parse a voltage string into a pint Quantity.
 
     Args:
@@ -85,9 +113,10 @@ def parse_voltage(voltage_str: str) -> Union[pint.Quantity, str]:
     if voltage_str == "N/A" or not voltage_str:
         return voltage_str
 
+    ureg = _get_ureg()
     try:
         return ureg.Quantity(voltage_str)
-    except (ValueError, pint.UndefinedUnitError):
+    except (ValueError, _pint().UndefinedUnitError):
         # Try to parse as number + V if no unit specified
         try:
             value = float(voltage_str.replace("V", "").strip())
@@ -96,7 +125,7 @@ def parse_voltage(voltage_str: str) -> Union[pint.Quantity, str]:
             return voltage_str
 
 
-def format_voltage(voltage: Union[str, pint.Quantity]) -> str:
+def format_voltage(voltage: Union[str, "pint.Quantity"]) -> str:
     """Format voltage for display.
 
     Args:
@@ -154,7 +183,7 @@ def parse_voltage_range(voltage_range_str: str) -> str:
 
 
 def format_voltage_range(
-    vdd_min: Union[str, pint.Quantity], vdd_max: Union[str, pint.Quantity]
+    vdd_min: Union[str, "pint.Quantity"], vdd_max: Union[str, "pint.Quantity"]
 ) -> str:
     """Format a voltage range for display.
 
@@ -178,7 +207,7 @@ def format_voltage_range(
         return "N/A"
 
 
-def parse_temperature(temperature_str: str) -> Union[pint.Quantity, str]:
+def parse_temperature(temperature_str: str) -> Union["pint.Quantity", str]:
     """Parse a temperature string into a pint Quantity.
 
     Args:
@@ -190,6 +219,7 @@ def parse_temperature(temperature_str: str) -> Union[pint.Quantity, str]:
     if temperature_str == "N/A" or not temperature_str:
         return temperature_str
 
+    ureg = _get_ureg()
     try:
         import re
 
@@ -210,11 +240,11 @@ def parse_temperature(temperature_str: str) -> Union[pint.Quantity, str]:
         else:
             # Fallback to original behavior for other formats
             return ureg.Quantity(temperature_str.replace("°", " "))
-    except (ValueError, pint.UndefinedUnitError):
+    except (ValueError, _pint().UndefinedUnitError):
         return temperature_str
 
 
-def format_temperature(temperature: Union[str, pint.Quantity]) -> str:
+def format_temperature(temperature: Union[str, "pint.Quantity"]) -> str:
     """Format temperature for display.
 
     Args:
@@ -242,7 +272,7 @@ def format_temperature(temperature: Union[str, pint.Quantity]) -> str:
         # Format with degree symbol
         temp_c = temperature_qty.to("celsius")
         return f"{temp_c.magnitude:g}°C"
-    except (AttributeError, TypeError, pint.UndefinedUnitError):
+    except (AttributeError, TypeError, _pint().UndefinedUnitError):
         return str(temperature_qty)
 
 
@@ -124,3 +124,11 @@ def atmel_atmega_atmega16_atdf_content(atmel_atmega_atpack_file: Path) -> str:
     """Fixture that provides ATmega16 content from the AtPack file."""
     skip_if_atpack_missing(atmel_atmega_atpack_file, "ATMEL")
     return read_from_atpack(atmel_atmega_atpack_file, "atdf/ATmega16.atdf", "ATDF")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep on-disk caches written by tests out of the user's cache directory."""
+    from atpack_parser.utils import cache
+
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path_factory.mktemp("cache"))
@@ -139,6 +139,176 @@ def test_cli_via_module_version():
         print(f"⚠️ Error testing module CLI: {e}")
 
 
+def test_detect_atmel_pin_type():
+    """Test ATMEL pin type inference from pad names."""
+    from atpack_parser.cli.devices import _detect_atmel_pin_type
+
+    assert _detect_atmel_pin_type("") == "Unknown"
+    assert _detect_atmel_pin_type("vcc") == "power"
+    assert _detect_atmel_pin_type("AVSS") == "power"  # power takes precedence
+    assert _detect_atmel_pin_type("RESET") == "control"
+    assert _detect_atmel_pin_type("XTAL1") == "oscillator"
+    assert _detect_atmel_pin_type("ADC6") == "analog"
+    assert _detect_atmel_pin_type("UPDI") == "programming"
+    assert _detect_atmel_pin_type("PB3") == "digital"
+    print("✓ ATMEL pin type detection works")
+
+
+def test_pin_position_sort_key():
+    """Test that numeric pin positions sort numerically before named ones."""
+    from atpack_parser.cli.devices import _PinRow, _pin_position_key
+
+    pins = [_PinRow("PKG", position, "", "", []) for position in ["10", "B", "2", "A"]]
+    positions = [pin.position for pin in sorted(pins, key=_pin_position_key)]
+
+    assert positions == ["2", "10", "A", "B"]
+    print("✓ Pin position sorting works")
+
+
+def test_format_plain_table():
+    """Test that plain tables pad every column to its widest cell."""
+    from atpack_parser.cli.devices import _format_plain_table
+
+    lines = _format_plain_table(
+        "Title", ["Pin", "Type"], [["1", "digital"], ["29", ""]]
+    )
+
+    assert lines == [
+        "Title",
+        "Pin  Type",
+        "---  -------",
+        "1    digital",
+        "29",
+    ]
+    print("✓ Plain table formatting works")
+
+
+def test_bitfield_rows():
+    """Test bitfield rows with multi-bit fields, their aliases and shared bits."""
+    from atpack_parser.cli.registers import _bitfield_rows
+    from atpack_parser.models import Register, RegisterBitfield
+
+    def bitfield(name, offset, width=1, **kwargs):
+        mask = ((1 << width) - 1) << offset
+        return RegisterBitfield(
+            name=name, mask=mask, bit_offset=offset, bit_width=width, **kwargs
+        )
+
+    register = Register(
+        name="T0CON",
+        offset=0,
+        size=1,
+        bitfields=[
+            bitfield("T0ON", 7, caption="Timer enable"),
+            bitfield("T0PS0", 2),
+            bitfield("T0PS", 2, width=2, values={0: "1:1", 1: "1:2"}),
+            bitfield("T0PS1", 3),
+            bitfield("TMR0_IF", 0),
+            bitfield("TMR0IF", 0),
+            bitfield("T0IF", 0),
+        ],
+    )
+
+    assert _bitfield_rows(register) == [
+        ("T0IF", "0", "0x01", "N/A", "N/A"),
+        ("├─ TMR0_IF", "0", "0x01", "N/A", "N/A"),
+        ("├─ TMR0IF", "0", "0x01", "N/A", "N/A"),
+        ("T0PS", "3:2", "0x0C", "N/A", "2 values"),
+        ("├─ T0PS0", "2", "0x04", "N/A", "N/A"),
+        ("├─ T0PS1", "3", "0x08", "N/A", "N/A"),
+        ("T0ON", "7", "0x80", "Timer enable", "N/A"),
+    ]
+    print("✓ Bitfield rows built")
+
+
+def test_stream_json_matches_json_dump():
+    """Test that streamed JSON arrays are laid out like json.dumps(indent=2)."""
+    import io
+    import json
+
+    from atpack_parser.cli.common import _write_json_array
+
+    for items in ([], [1], [{"name": "FLASH", "segments": [{"size": 2}]}, {}]):
+        stream = io.BytesIO()
+        documents = (json.dumps(item, indent=2).encode() for item in items)
+        _write_json_array(documents, stream.write)
+        assert stream.getvalue() == json.dumps(items, indent=2).encode()
+    print("✓ Streamed JSON output works")
+
+
+def test_json_export_matches_json_dumps():
+    """Test that exported JSON is identical with or without orjson."""
+    import json
+
+    from atpack_parser.cli.common import _dumps_bytes
+
+    for data in ([], {"temp_range": "-40°C to 85°C", "values": {3: 2**70}}):
+        assert _dumps_bytes(data) == json.dumps(data, indent=2).encode("utf-8")
+    print("✓ JSON export encoding works")
+
+
+def test_get_parser_closes_replaced_parser(tmp_path, monkeypatch):
+    """Test that a cached parser is closed once its AtPack file changes."""
+    import os
+    import zipfile
+
+    from atpack_parser.cli import common
+
+    monkeypatch.setattr(common, "_parser_cache", common.OrderedDict())
+    atpack_file = tmp_path / "test.atpack"
+    with zipfile.ZipFile(atpack_file, "w") as zf:
+        zf.writestr("test.pdsc", "<package/>")
+
+    parser = common.get_parser(atpack_file)
+    assert common.get_parser(atpack_file) is parser
+    parser.list_files()
+    assert parser.extractor._zip_file is not None
+
+    stat = atpack_file.stat()
+    os.utime(atpack_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert common.get_parser(atpack_file) is not parser
+    assert parser.extractor._zip_file is None
+    print("✓ Stale cached parser closed")
+
+
+def test_json_export_compact_unless_pretty(tmp_path, monkeypatch):
+    """Test compact JSON files by default, indented with --pretty or on stdout."""
+    import json
+
+    from atpack_parser.cli import common
+
+    runner = CliRunner()
+    monkeypatch.setattr(common, "_parser_cache", common.OrderedDict())
+    (tmp_path / "ATmegaT1.atdf").write_text(
+        '<avr-tools-device-file><devices><device name="ATmegaT1"'
+        ' architecture="AVR8" family="megaAVR"><address-spaces>'
+        '<address-space id="prog" name="prog" start="0" size="0x4000">'
+        '<memory-segment name="FLASH" start="0" size="0x4000" type="flash"/>'
+        "</address-space></address-spaces></device></devices><modules>"
+        '<module name="PORT"><register-group name="PORTB">'
+        '<register name="PORTB" offset="0x25" size="1"/>'
+        "</register-group></module></modules></avr-tools-device-file>"
+    )
+    output = tmp_path / "out.json"
+
+    for command in (["memory", "show"], ["registers", "list"]):
+        args = command + ["ATmegaT1", str(tmp_path), "--format", "json"]
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert result.output.rstrip("\n") == json.dumps(data, indent=2)
+
+        result = runner.invoke(app, args + ["-o", str(output)])
+        assert result.exit_code == 0
+        assert output.read_text() == json.dumps(data, separators=(",", ":"))
+
+        result = runner.invoke(app, args + ["-o", str(output), "--pretty"])
+        assert result.exit_code == 0
+        assert output.read_text() == json.dumps(data, indent=2)
+    print("✓ JSON exports compact unless --pretty")
+
+
 @pytest.mark.integration
 def test_all_cli_functionality():
     """Integration test that runs all CLI functionality tests."""
@@ -28,6 +28,205 @@ class TestAtPackParser:
         # This would need a real AtPack file for testing
         pass
 
+    def test_file_pattern_matching(self):
+        """Test substring and glob file pattern matching."""
+        from atpack_parser.atpack_extractor import _path_matcher
+
+        paths = ["atdf/ATmega16.atdf", "include/avr/iom16.h", "Atmel.pdsc"]
+
+        assert [p for p in paths if _path_matcher(None)(p)] == paths
+        assert [p for p in paths if _path_matcher("16")(p)] == [
+            "atdf/ATmega16.atdf",
+            "include/avr/iom16.h",
+        ]
+        assert [p for p in paths if _path_matcher("atdf/*.atdf")(p)] == [
+            "atdf/ATmega16.atdf"
+        ]
+        assert [p for p in paths if _path_matcher("*.pdsc")(p)] == ["Atmel.pdsc"]
+
+    def test_read_xml_reuses_parsed_tree(self, tmp_path):
+        """Test that the extractor parses each XML file once."""
+        from atpack_parser.atpack_extractor import AtPackExtractor
+
+        (tmp_path / "PIC16T1.PIC").write_text(
+            '<edc:PIC xmlns:edc="http://crownking/edc"/>'
+        )
+        extractor = AtPackExtractor(tmp_path)
+
+        root = extractor.read_xml("PIC16T1.PIC")
+        assert extractor.read_xml("PIC16T1.PIC") is root
+
+    def test_all_device_specs_cached_on_disk(self, tmp_path, monkeypatch):
+        """Test that all-device specs of an unchanged AtPack zip are reused."""
+        import zipfile
+
+        from atpack_parser import device_specs
+        from atpack_parser.utils import cache
+
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+        atpack_file = tmp_path / "PIC.atpack"
+        with zipfile.ZipFile(atpack_file, "w") as zf:
+            zf.writestr(
+                "edc/PIC16T1.PIC",
+                '<edc:PIC xmlns:edc="http://crownking/edc" edc:name="PIC16T1"/>',
+            )
+
+        parser = AtPackParser(atpack_file)
+        specs = parser.get_all_device_specs(use_cache=True)
+        assert [s.device_name for s in specs] == ["PIC16T1"]
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        monkeypatch.setattr(device_specs, "_extract_one", None)
+        assert parser.get_all_device_specs(use_cache=True) == specs
+
+    def test_partial_device_specs_not_cached(self, tmp_path, monkeypatch):
+        """Test that specs are not saved when a PIC file failed to parse."""
+        import zipfile
+
+        from atpack_parser.utils import cache
+
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+        atpack_file = tmp_path / "PIC.atpack"
+        with zipfile.ZipFile(atpack_file, "w") as zf:
+            zf.writestr(
+                "edc/PIC16T1.PIC",
+                '<edc:PIC xmlns:edc="http://crownking/edc" edc:name="PIC16T1"/>',
+            )
+            zf.writestr("edc/PIC16T2.PIC", "<edc:PIC")
+
+        specs = AtPackParser(atpack_file).get_all_device_specs(use_cache=True)
+        assert [s.device_name for s in specs] == ["PIC16T1"]
+        assert not (tmp_path / "cache").exists()
+
+    def test_all_device_specs_skip_unreadable_files(self, tmp_path, monkeypatch):
+        """Test that both extraction modes skip a PIC file that cannot be read."""
+        for name in ("PIC16T1", "PIC16T2"):
+            (tmp_path / f"{name}.PIC").write_text(
+                f'<edc:PIC xmlns:edc="http://crownking/edc" edc:name="{name}"/>'
+            )
+        parser = AtPackParser(tmp_path)
+        read_file = parser.extractor.read_file
+
+        def failing_read_file(path):
+            if "T2" in path:
+                raise OSError("unreadable")
+            return read_file(path)
+
+        monkeypatch.setattr(parser.extractor, "read_file", failing_read_file)
+        monkeypatch.setattr(parser.extractor, "read_bytes", failing_read_file)
+
+        for parallel in (False, True):
+            specs = parser.get_all_device_specs(parallel=parallel)
+            assert [s.device_name for s in specs] == ["PIC16T1"]
+
+    def test_pic_device_specs_memory(self):
+        """Test PIC memory sizes and addresses, ignoring shadow code sectors."""
+        from atpack_parser.parser.pic import PicParser
+
+        pic = PicParser(
+            '<edc:PIC xmlns:edc="http://crownking/edc" edc:name="PIC16T1">'
+            "<edc:ProgramSpace>"
+            '<edc:CodeSector edc:beginaddr="0x0" edc:endaddr="0x800"/>'
+            '<edc:CodeSector edc:beginaddr="0x0" edc:endaddr="0x800"'
+            ' edc:shadowidref="CODE"/>'
+            '<edc:EEDataSector edc:beginaddr="0xf000" edc:endaddr="0xf100"/>'
+            '<edc:ConfigFuseSector edc:beginaddr="0x8007" edc:endaddr="0x8009"/>'
+            "</edc:ProgramSpace><edc:DataSpace><edc:RegardlessOfMode>"
+            '<edc:GPRDataSector edc:beginaddr="0x20" edc:endaddr="0x80"'
+            ' edc:bank="0"/>'
+            "</edc:RegardlessOfMode></edc:DataSpace></edc:PIC>"
+        )
+        specs = pic.extract_device_specs("PIC16T1")
+
+        assert specs.maximum_size == 0x800
+        assert (specs.eeprom_addr, specs.eeprom_size) == ("0xF000", 0x100)
+        assert (specs.config_addr, specs.config_size) == ("0x8007", 2)
+        assert specs.gpr_total_size == specs.maximum_ram_size == 0x60
+        assert [(s.name, s.start_addr, s.size, s.bank) for s in specs.gpr_sectors] == [
+            ("GPR_BANK0", 0x20, 0x60, "0")
+        ]
+
+    def test_pdsc_read_once(self, tmp_path, monkeypatch):
+        """Test that metadata, family and device list share one PDSC parse."""
+        from atpack_parser.models import DeviceFamily
+
+        (tmp_path / "Microchip.PIC16_DFP.pdsc").write_text(
+            '<package vendor="Microchip" name="PIC16_DFP" version="1.0.0">'
+            '<devices><family Dfamily="PIC16"><device Dname="PIC16T1"/>'
+            "</family></devices></package>"
+        )
+        (tmp_path / "PIC16T1.PIC").write_text(
+            '<edc:PIC xmlns:edc="http://crownking/edc"/>'
+        )
+        parser = AtPackParser(tmp_path)
+        reads = []
+        read_file = parser.extractor.read_file
+        monkeypatch.setattr(
+            parser.extractor,
+            "read_file",
+            lambda path: reads.append(path) or read_file(path),
+        )
+
+        assert parser.metadata.name == "PIC16_DFP"
+        assert parser.device_family == DeviceFamily.PIC
+        assert parser.get_devices() == ["PIC16T1"]
+        assert parser.to_dict()["devices"] == ["PIC16T1"]
+        assert len(reads) == 1
+
+    def test_pdsc_list_devices(self):
+        """Test device, subfamily and variant names listed from a PDSC."""
+        from atpack_parser.parser.pdsc import PdscParser
+
+        pdsc = PdscParser(
+            '<package vendor="Microchip"><devices><family Dfamily="ATmega">'
+            '<device Dname="ATmega16" Dcore="AVR8"><variant Dvariant="ATmega16A"/>'
+            '</device><subFamily><device Dname="ATmega8"/></subFamily>'
+            "</family></devices></package>"
+        )
+
+        assert pdsc.list_devices() == ["ATmega16", "ATmega16A", "ATmega8"]
+
+    def test_pdsc_detect_device_family(self):
+        """Test ATMEL detection from cores and families of a Microchip PDSC."""
+        from atpack_parser.models import DeviceFamily
+        from atpack_parser.parser.pdsc import PdscParser
+
+        def family(dfamily, dcore):
+            return PdscParser(
+                f'<package vendor="Microchip"><devices><family Dfamily="{dfamily}">'
+                f'<device Dname="D1" Dcore="{dcore}"/></family></devices></package>'
+            ).detect_device_family()
+
+        assert family("ATmega", "PIC") == DeviceFamily.ATMEL
+        assert family("Other", "AVR8") == DeviceFamily.ATMEL
+        assert family("PIC32CM", "Cortex-M0+") == DeviceFamily.PIC
+        assert family("PIC16", "PIC") == DeviceFamily.PIC
+
+    def test_register_index(self):
+        """Test case-insensitive register lookup keeping the first match."""
+        from atpack_parser.models import (
+            Device,
+            DeviceFamily,
+            Module,
+            Register,
+            RegisterGroup,
+        )
+
+        def module(name, offset):
+            group = RegisterGroup(
+                name=name, registers=[Register(name="PORTB", offset=offset, size=1)]
+            )
+            return Module(name=name, register_groups=[group])
+
+        device = Device(
+            name="ATmegaT1",
+            family=DeviceFamily.ATMEL,
+            modules=[module("PORTB", 0x25), module("ALIAS", 0x45)],
+        )
+
+        assert device.register_index["PORTB"].offset == 0x25
+        assert "PORTC" not in device.register_index
+
 
 if __name__ == "__main__":
     pytest.main([__file__])